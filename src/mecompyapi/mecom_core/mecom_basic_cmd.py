@@ -1,4 +1,5 @@
 import logging
+from typing import List, Tuple, Dict, Optional, Union
 
 from mecompyapi.mecom_core.com_command_exception import ComCommandException
 from mecompyapi.mecom_core.mecom_frame import MeComPacket
@@ -19,6 +20,10 @@ class MeComBasicCmd:
         :type mequery_set: MeComQuerySet
         """
         self.mequery_set: MeComQuerySet = mequery_set
+        # "?VR" payloads keyed by (parameter_id, instance); they never change, only the frame around them does
+        self._read_payload_cache: Dict[Tuple[int, int], str] = {}
+        # "VS" payload prefixes keyed by (parameter_id, instance); only the value is added per call
+        self._write_payload_cache: Dict[Tuple[int, int], str] = {}
 
         # self.address = self.get_device_address()
 
@@ -106,9 +111,7 @@ class MeComBasicCmd:
         mecom_var_convert: MeComVarConvert = MeComVarConvert()
         try:
             tx_frame: MeComPacket = MeComPacket(control="#", address=address)
-            tx_frame.payload = mecom_var_convert.add_string(stream=tx_frame.payload, value="?VR")
-            tx_frame.payload = mecom_var_convert.add_uint16(stream=tx_frame.payload, value=parameter_id)
-            tx_frame.payload = mecom_var_convert.add_uint8(stream=tx_frame.payload, value=instance)
+            tx_frame.payload = self._read_payload(parameter_id=parameter_id, instance=instance)
             rx_frame: MeComPacket = self.mequery_set.query(tx_frame=tx_frame)
             return mecom_var_convert.read_int32(rx_frame.payload)
         except Exception as e:
@@ -131,14 +134,136 @@ class MeComBasicCmd:
         mecom_var_convert: MeComVarConvert = MeComVarConvert()
         try:
             tx_frame: MeComPacket = MeComPacket(control="#", address=address)
-            tx_frame.payload = mecom_var_convert.add_string(stream=tx_frame.payload, value="?VR")
-            tx_frame.payload = mecom_var_convert.add_uint16(stream=tx_frame.payload, value=parameter_id)
-            tx_frame.payload = mecom_var_convert.add_uint8(stream=tx_frame.payload, value=instance)
+            tx_frame.payload = self._read_payload(parameter_id=parameter_id, instance=instance)
             rx_frame: MeComPacket = self.mequery_set.query(tx_frame=tx_frame)
             return mecom_var_convert.read_float32(rx_frame.payload)
         except Exception as e:
             raise ComCommandException(f"Get FLOAT Value failed: {e}")
 
+    def get_float_values(self, address: int, parameters: List[Tuple[int, int]]) -> List[float]:
+        """
+        Returns several float 32Bit values from the device with one pipelined transaction.
+
+        :param address: Device Address. Use null to use the DefaultDeviceAddress defined on MeComQuerySet.
+        :type address: int
+        :param parameters: Pairs of Device Parameter ID and Parameter Instance.
+        :type parameters: List[Tuple[int, int]]
+        :raises ComCommandException: When the command fails. Check the inner exception for details.
+        :return: Returned values, in the order of the parameters.
+        :rtype: List[float]
+        """
+        mecom_var_convert: MeComVarConvert = MeComVarConvert()
+        try:
+            rx_frames: List[MeComPacket] = self._query_values(address=address, parameters=parameters)
+            return [mecom_var_convert.read_float32(rx_frame.payload) for rx_frame in rx_frames]
+        except Exception as e:
+            raise ComCommandException(f"Get FLOAT Values failed: {e}")
+
+    def get_int32_values(self, address: int, parameters: List[Tuple[int, int]]) -> List[int]:
+        """
+        Returns several signed int 32Bit values from the device with one pipelined transaction.
+
+        :param address: Device Address. Use null to use the DefaultDeviceAddress defined on MeComQuerySet.
+        :type address: int
+        :param parameters: Pairs of Device Parameter ID and Parameter Instance.
+        :type parameters: List[Tuple[int, int]]
+        :raises ComCommandException: When the command fails. Check the inner exception for details.
+        :return: Returned values, in the order of the parameters.
+        :rtype: List[int]
+        """
+        mecom_var_convert: MeComVarConvert = MeComVarConvert()
+        try:
+            rx_frames: List[MeComPacket] = self._query_values(address=address, parameters=parameters)
+            return [mecom_var_convert.read_int32(rx_frame.payload) for rx_frame in rx_frames]
+        except Exception as e:
+            raise ComCommandException(f"Get INT32 Values failed: {e}")
+
+    def get_values(self, address: int, parameters: List[Tuple[int, int, type]]) -> List[Union[float, int]]:
+        """
+        Returns several float 32Bit and signed int 32Bit values from the device with one pipelined transaction.
+
+        :param address: Device Address. Use null to use the DefaultDeviceAddress defined on MeComQuerySet.
+        :type address: int
+        :param parameters: Device Parameter ID, Parameter Instance and value type (float or int) of each value.
+        :type parameters: List[Tuple[int, int, type]]
+        :raises ComCommandException: When the command fails. Check the inner exception for details.
+        :return: Returned values, in the order of the parameters.
+        :rtype: List[Union[float, int]]
+        """
+        mecom_var_convert: MeComVarConvert = MeComVarConvert()
+        try:
+            rx_frames: List[MeComPacket] = self._query_values(
+                address=address, parameters=[(parameter_id, instance) for parameter_id, instance, _ in parameters]
+            )
+            return [
+                mecom_var_convert.read_float32(rx_frame.payload) if value_type is float
+                else mecom_var_convert.read_int32(rx_frame.payload)
+                for (_, _, value_type), rx_frame in zip(parameters, rx_frames)
+            ]
+        except Exception as e:
+            raise ComCommandException(f"Get Values failed: {e}")
+
+    def _query_values(self, address: int, parameters: List[Tuple[int, int]]) -> List[MeComPacket]:
+        """
+        Queries several parameter values with one pipelined transaction.
+
+        :param address: Device Address. Use null to use the DefaultDeviceAddress defined on MeComQuerySet.
+        :type address: int
+        :param parameters: Pairs of Device Parameter ID and Parameter Instance.
+        :type parameters: List[Tuple[int, int]]
+        :return: Received data, one packet per parameter.
+        :rtype: List[MeComPacket]
+        """
+        tx_frames: List[MeComPacket] = []
+        for parameter_id, instance in parameters:
+            tx_frame: MeComPacket = MeComPacket(control="#", address=address)
+            tx_frame.payload = self._read_payload(parameter_id=parameter_id, instance=instance)
+            tx_frames.append(tx_frame)
+        return self.mequery_set.query_batch(tx_frames=tx_frames)
+
+    def _read_payload(self, parameter_id: int, instance: int) -> str:
+        """
+        Returns the "?VR" payload reading the given parameter, built once per parameter and instance.
+
+        :param parameter_id: Device Parameter ID.
+        :type parameter_id: int
+        :param instance: Parameter Instance. (usually 1)
+        :type instance: int
+        :return: The payload.
+        :rtype: str
+        """
+        key: Tuple[int, int] = (parameter_id, instance)
+        payload: Optional[str] = self._read_payload_cache.get(key)
+        if payload is None:
+            mecom_var_convert: MeComVarConvert = MeComVarConvert()
+            payload = mecom_var_convert.add_string(stream="", value="?VR")
+            payload = mecom_var_convert.add_uint16(stream=payload, value=parameter_id)
+            payload = mecom_var_convert.add_uint8(stream=payload, value=instance)
+            self._read_payload_cache[key] = payload
+        return payload
+
+    def _write_payload_prefix(self, parameter_id: int, instance: int) -> str:
+        """
+        Returns the "VS" payload prefix writing the given parameter, built once per parameter and instance.
+        The value to write is added after the prefix.
+
+        :param parameter_id: Device Parameter ID.
+        :type parameter_id: int
+        :param instance: Parameter Instance. (usually 1)
+        :type instance: int
+        :return: The payload prefix.
+        :rtype: str
+        """
+        key: Tuple[int, int] = (parameter_id, instance)
+        prefix: Optional[str] = self._write_payload_cache.get(key)
+        if prefix is None:
+            mecom_var_convert: MeComVarConvert = MeComVarConvert()
+            prefix = mecom_var_convert.add_string(stream="", value="VS")
+            prefix = mecom_var_convert.add_uint16(stream=prefix, value=parameter_id)
+            prefix = mecom_var_convert.add_uint8(stream=prefix, value=instance)
+            self._write_payload_cache[key] = prefix
+        return prefix
+
     def get_double_value(self, address: int, parameter_id: int, instance: int) -> str:
         """
         Returns a double 64Bit value from the device.
@@ -153,12 +278,9 @@ class MeComBasicCmd:
         :return: Returned value.
         :rtype: str
         """
-        mecom_var_convert: MeComVarConvert = MeComVarConvert()
         try:
             tx_frame: MeComPacket = MeComPacket(control="#", address=address)
-            tx_frame.payload = mecom_var_convert.add_string(stream=tx_frame.payload, value="?VR")
-            tx_frame.payload = mecom_var_convert.add_uint16(stream=tx_frame.payload, value=parameter_id)
-            tx_frame.payload = mecom_var_convert.add_uint8(stream=tx_frame.payload, value=instance)
+            tx_frame.payload = self._read_payload(parameter_id=parameter_id, instance=instance)
             rx_frame: MeComPacket = self.mequery_set.query(tx_frame=tx_frame)
             return rx_frame.payload
         except Exception as e:
@@ -178,12 +300,9 @@ class MeComBasicCmd:
         :return: Returned value.
         :rtype: str
         """
-        mecom_var_convert: MeComVarConvert = MeComVarConvert()
         try:
             tx_frame: MeComPacket = MeComPacket(control="#", address=address)
-            tx_frame.payload = mecom_var_convert.add_string(stream=tx_frame.payload, value="?VR")
-            tx_frame.payload = mecom_var_convert.add_uint16(stream=tx_frame.payload, value=parameter_id)
-            tx_frame.payload = mecom_var_convert.add_uint8(stream=tx_frame.payload, value=instance)
+            tx_frame.payload = self._read_payload(parameter_id=parameter_id, instance=instance)
             rx_frame: MeComPacket = self.mequery_set.query(tx_frame=tx_frame)
             return rx_frame.payload
         except Exception as e:
@@ -206,9 +325,7 @@ class MeComBasicCmd:
         mecom_var_convert: MeComVarConvert = MeComVarConvert()
         try:
             tx_frame: MeComPacket = MeComPacket(control="#", address=address)
-            tx_frame.payload = mecom_var_convert.add_string(stream=tx_frame.payload, value="VS")
-            tx_frame.payload = mecom_var_convert.add_uint16(stream=tx_frame.payload, value=parameter_id)
-            tx_frame.payload = mecom_var_convert.add_uint8(stream=tx_frame.payload, value=instance)
+            tx_frame.payload = self._write_payload_prefix(parameter_id=parameter_id, instance=instance)
             tx_frame.payload = mecom_var_convert.add_int32(stream=tx_frame.payload, value=value)
             rx_frame: MeComPacket = self.mequery_set.set(tx_frame=tx_frame)
             return rx_frame
@@ -236,9 +353,7 @@ class MeComBasicCmd:
         mecom_var_convert: MeComVarConvert = MeComVarConvert()
         try:
             tx_frame: MeComPacket = MeComPacket(control="#", address=address)
-            tx_frame.payload = mecom_var_convert.add_string(stream=tx_frame.payload, value="VS")
-            tx_frame.payload = mecom_var_convert.add_uint16(stream=tx_frame.payload, value=parameter_id)
-            tx_frame.payload = mecom_var_convert.add_uint8(stream=tx_frame.payload, value=instance)
+            tx_frame.payload = self._write_payload_prefix(parameter_id=parameter_id, instance=instance)
             tx_frame.payload = mecom_var_convert.add_int64(stream=tx_frame.payload, value=value)
             rx_frame: MeComPacket = self.mequery_set.set(tx_frame=tx_frame)
             return rx_frame
@@ -266,9 +381,7 @@ class MeComBasicCmd:
         mecom_var_convert: MeComVarConvert = MeComVarConvert()
         try:
             tx_frame: MeComPacket = MeComPacket(control="#", address=address)
-            tx_frame.payload = mecom_var_convert.add_string(stream=tx_frame.payload, value="VS")
-            tx_frame.payload = mecom_var_convert.add_uint16(stream=tx_frame.payload, value=parameter_id)
-            tx_frame.payload = mecom_var_convert.add_uint8(stream=tx_frame.payload, value=instance)
+            tx_frame.payload = self._write_payload_prefix(parameter_id=parameter_id, instance=instance)
             tx_frame.payload = mecom_var_convert.add_float32(stream=tx_frame.payload, value=value)
             rx_frame: MeComPacket = self.mequery_set.set(tx_frame=tx_frame)
             return rx_frame
@@ -298,9 +411,7 @@ class MeComBasicCmd:
         mecom_var_convert: MeComVarConvert = MeComVarConvert()
         try:
             tx_frame: MeComPacket = MeComPacket(control="#", address=address)
-            tx_frame.payload = mecom_var_convert.add_string(stream=tx_frame.payload, value="VS")
-            tx_frame.payload = mecom_var_convert.add_uint16(stream=tx_frame.payload, value=parameter_id)
-            tx_frame.payload = mecom_var_convert.add_uint8(stream=tx_frame.payload, value=instance)
+            tx_frame.payload = self._write_payload_prefix(parameter_id=parameter_id, instance=instance)
             tx_frame.payload = mecom_var_convert.add_double64(stream=tx_frame.payload, value=value)
             rx_frame: MeComPacket = self.mequery_set.set(tx_frame=tx_frame)
             return rx_frame
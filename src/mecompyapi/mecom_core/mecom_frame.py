@@ -1,9 +1,8 @@
+from binascii import crc_hqx
 from enum import Enum
-from typing import Optional
+from typing import Optional, List
 from dataclasses import dataclass
 
-from PyCRC.CRCCCITT import CRCCCITT
-
 from mecompyapi.mecom_core.mecom_var_convert import MeComVarConvert
 from mecompyapi.phy_wrapper.mecom_phy_serial_port import MeComPhySerialPort
 
@@ -115,54 +114,90 @@ class MeComFrame:
         :raises MeComPhyInterfaceException:
         :return: None
         """
-        mecom_var_convert = MeComVarConvert()
-
-        # Build the Transmit Frame (i.e. tx_stream)
-        tx_stream: str = ""
-        tx_stream += tx_frame.control
-
-        tx_stream = mecom_var_convert.add_uint8(stream=tx_stream, value=tx_frame.address)
-
-        tx_stream = mecom_var_convert.add_uint16(stream=tx_stream, value=tx_frame.sequence_number)
+        self.phy_com.send_string(stream=self._encode_frame(tx_frame=tx_frame))
 
-        tx_stream += tx_frame.payload
+    def receive_frame_or_timeout(self) -> MeComPacket:
+        """
+        Receives a correct frame or throws a timeout exception.
 
-        self.last_crc: int = self._calc_crc_citt(frame=tx_stream.encode())
+        :return: Received data.
+        :rtype: MeComPacket
+        """
+        rx_frame: MeComPacket = MeComPacket()
+        rx_frame.receive_type = ERcvType.EMPTY
 
-        tx_stream = mecom_var_convert.add_uint16(stream=tx_stream, value=self.last_crc)
+        rx_stream: str = self.phy_com.get_data_or_timeout().decode("ascii")
 
-        # add end of line (carriage return)
-        tx_stream += "\r"
+        rx_frame = self._decode_frame(rx_frame=rx_frame, rx_stream=rx_stream)
 
-        self.phy_com.send_string(stream=tx_stream)
+        return rx_frame
 
-    def receive_frame_or_timeout(self) -> MeComPacket:
+    def transact_frame(self, tx_frame: MeComPacket) -> MeComPacket:
         """
-        Receives a correct frame or throws a timeout exception.
+        Sends the given frame and receives the answer with a single call
+        to the physical interface.
 
+        :param tx_frame: Data to send.
+        :type tx_frame: MeComPacket
+        :raises MeComPhyInterfaceException:
+        :raises MeComPhyTimeoutException:
         :return: Received data.
         :rtype: MeComPacket
         """
         rx_frame: MeComPacket = MeComPacket()
         rx_frame.receive_type = ERcvType.EMPTY
 
-        rx_stream: str = self.phy_com.get_data_or_timeout()
+        rx_stream: str = self.phy_com.transact(stream=self._encode_frame(tx_frame=tx_frame)).decode("ascii")
 
         rx_frame = self._decode_frame(rx_frame=rx_frame, rx_stream=rx_stream)
 
         return rx_frame
 
-    def _decode_frame(
-            self, rx_frame: MeComPacket, rx_stream: str, local_rx_buf: Optional = None
-    ) -> MeComPacket:
+    def transact_frames(self, tx_frames: List[MeComPacket]) -> List[MeComPacket]:
+        """
+        Sends all given frames back-to-back with a single write to the physical
+        interface and then receives one answer per frame, in order.
+
+        Only data answers can be matched this way, because the acknowledge check
+        compares against the CRC of the last sent frame.
+
+        :param tx_frames: Data to send.
+        :type tx_frames: List[MeComPacket]
+        :raises MeComPhyInterfaceException:
+        :raises MeComPhyTimeoutException:
+        :return: Received data, one packet per sent frame.
+        :rtype: List[MeComPacket]
+        """
+        self.phy_com.send_string(stream=b"".join([self._encode_frame(tx_frame=tx_frame) for tx_frame in tx_frames]))
+        return [self.receive_frame_or_timeout() for _ in tx_frames]
+
+    def _encode_frame(self, tx_frame: MeComPacket) -> bytes:
+        """
+        Serializes the given Data structure to a proper frame.
+
+        :param tx_frame: Data to send.
+        :type tx_frame: MeComPacket
+        :return: The frame, including the CRC and the terminating carriage return.
+        :rtype: bytes
+        """
+        # Build the Transmit Frame (i.e. tx_stream) up to the CRC in one go: control char,
+        # UINT8 address, UINT16 sequence number and the (cached) payload string
+        tx_stream: bytes = (
+            f"{tx_frame.control}{tx_frame.address:02X}{tx_frame.sequence_number:04X}{tx_frame.payload}"
+        ).encode("ascii")
+
+        self.last_crc: int = self._calc_crc_citt(frame=tx_stream)
+
+        # add the UINT16 CRC and the end of line (carriage return)
+        return b"%s%04X\r" % (tx_stream, self.last_crc)
+
+    def _decode_frame(self, rx_frame: MeComPacket, rx_stream: str) -> MeComPacket:
         """
 
         :param rx_frame:
         :type rx_frame: MeComPacket
         :param rx_stream:
         :type rx_stream: bytes
-        :param local_rx_buf:
-        :type local_rx_buf:
         :return:
         :return: MeComPacket
         """
@@ -188,7 +223,7 @@ class MeComFrame:
             rcv_crc = int(rx_stream[-4:], 16)
 
             # Cut received CRC from stream and recalc CRC
-            calc_crc = self._calc_crc_citt(frame=rx_stream[:-4].encode())
+            calc_crc = self._calc_crc_citt(frame=rx_stream[:-4].encode("ascii"))
 
             if calc_crc == rcv_crc:
                 rx_frame.address = mecom_var_convert.read_uint8(stream=rx_stream[1:3])
@@ -202,12 +237,13 @@ class MeComFrame:
 
     def _calc_crc_citt(self, frame: bytes) -> int:
         """
-        Calculate the checksum of a given frame
+        Calculate the checksum of a given frame. MeCom uses CRC-16-CCITT (XModem)
+        with a start value of 0, which binascii computes table driven in C.
 
         :param frame: mecom frame without the checksum
         :type frame: bytes
         :return: the checksum for the given frame
         :rtype: int
         """
-        crc: int = CRCCCITT().calculate(input_data=frame)
+        crc: int = crc_hqx(frame, 0)
         return crc
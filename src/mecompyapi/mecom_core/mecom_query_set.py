@@ -1,6 +1,7 @@
+import logging
 import random
 
-from typing import Union
+from typing import Union, List
 
 from mecompyapi.mecom_core.mecom_frame import MeComFrame, MeComPacket, ERcvType
 from mecompyapi.phy_wrapper.int_mecom_phy import IntMeComPhy, MeComPhyTimeoutException
@@ -219,7 +220,8 @@ class MeComQuerySet:
             self.check_if_connected()
 
             try:
-                rx_frame: MeComPacket = self.local_query(tx_frame=tx_frame)
+                with self.phy_com.lock:
+                    rx_frame: MeComPacket = self.local_query(tx_frame=tx_frame)
                 return rx_frame
             except ServerException as e:
                 raise e
@@ -251,7 +253,8 @@ class MeComQuerySet:
             self.check_if_connected()
 
             try:
-                rx_frame: MeComPacket = self.local_set(tx_frame=tx_frame)
+                with self.phy_com.lock:
+                    rx_frame: MeComPacket = self.local_set(tx_frame=tx_frame)
                 return rx_frame
 
             except ServerException as e:
@@ -264,6 +267,51 @@ class MeComQuerySet:
         except NotConnectedException as e:
             raise e
 
+    def query_batch(self, tx_frames: List[MeComPacket]) -> List[MeComPacket]:
+        """
+        Executes several Queries in one pipelined transaction. All frames are written
+        back-to-back and the answers are read afterwards, so the link turnaround is
+        paid once instead of once per query.
+
+        If the pipelined transaction fails or an answer does not match its query,
+        every query is executed again one by one with the usual retries.
+
+        :param tx_frames: Definitions of the data to send.
+        :type tx_frames: List[MeComPacket]
+        :raises GeneralException: On timeout or any other exception. Check the
+            inner exception for details.
+        :raises ServerException: When the server replays with a Server Error Code.
+        :raises NotConnectedException: When the interface is not connected.
+            (Only if the calling thread is different from the creator of this object)
+        :return: Received data, one packet per query.
+        :rtype: List[MeComPacket]
+        """
+        self.check_if_connected()
+
+        with self.phy_com.lock:
+            for tx_frame in tx_frames:
+                if tx_frame.address is None:
+                    tx_frame.address = self.get_default_device_address()
+                self.sequence_number += 1
+                tx_frame.sequence_number = self.sequence_number
+
+            if all(tx_frame.address != 255 for tx_frame in tx_frames):
+                try:
+                    rx_frames: List[MeComPacket] = self.me_frame.transact_frames(tx_frames=tx_frames)
+                    if all(
+                        rx_frame.receive_type == ERcvType.DATA
+                        and rx_frame.sequence_number == tx_frame.sequence_number
+                        and rx_frame.address == tx_frame.address
+                        for tx_frame, rx_frame in zip(tx_frames, rx_frames)
+                    ):
+                        return rx_frames
+                except Exception as e:
+                    logging.debug("pipelined query failed, falling back to single queries : %s", e)
+                # Late answers of the pipelined transaction must not be taken for answers of the single queries
+                self.phy_com.discard_pending_input()
+
+            return [self.query(tx_frame=tx_frame) for tx_frame in tx_frames]
+
     def local_query(self, tx_frame: MeComPacket) -> MeComPacket:
         """
 
@@ -284,10 +332,10 @@ class MeComQuerySet:
             tx_frame.sequence_number = self.sequence_number
 
             try:
-                self.me_frame.send_frame(tx_frame=tx_frame)
                 if tx_frame.address == 255:
+                    self.me_frame.send_frame(tx_frame=tx_frame)
                     return rx_frame  # on the address 255, no answer is expected
-                rx_frame: MeComPacket = self.me_frame.receive_frame_or_timeout()
+                rx_frame: MeComPacket = self.me_frame.transact_frame(tx_frame=tx_frame)
                 # if rx_frame.receive_type == ERcvType.DATA and rx_frame.sequence_number and rx_frame.address == tx_frame.address:
                 #     # Corresponding Frame received
                 #     if rx_frame.payload.read_byte() == "+":
@@ -343,10 +391,10 @@ class MeComQuerySet:
             tx_frame.sequence_number = self.sequence_number
 
             try:
-                self.me_frame.send_frame(tx_frame)
                 if tx_frame.address == 255:
+                    self.me_frame.send_frame(tx_frame=tx_frame)
                     return rx_frame  # on the address 255, no answer is expected
-                rx_frame: MeComPacket = self.me_frame.receive_frame_or_timeout()
+                rx_frame: MeComPacket = self.me_frame.transact_frame(tx_frame=tx_frame)
                 # if rx_frame.sequence_number == self.sequence_number and rx_frame.address == tx_frame.address:
                 #     # Corresponding Frame received
                 #     if rx_frame.receive_type == ERcvType.DATA:
@@ -1,5 +1,5 @@
 from typing import List
-from struct import unpack, pack
+from struct import unpack, pack, Struct
 
 
 CONVERT_TO_HEX_DICT: dict[int, str] = {
@@ -18,6 +18,18 @@ CONVERT_TO_DEC_DICT: dict[str, int] = {
 }
 
 
+# Precompiled big endian layouts of the values read from a payload
+_UINT8: Struct = Struct("!B")
+_INT16: Struct = Struct("!h")
+_UINT16: Struct = Struct("!H")
+_INT32: Struct = Struct("!i")
+_UINT32: Struct = Struct("!I")
+_FLOAT32: Struct = Struct("!f")
+_INT64: Struct = Struct("!q")
+_UINT64: Struct = Struct("!Q")
+_DOUBLE64: Struct = Struct("!d")
+
+
 class MeComVarConvert:
     def __init__(self):
         pass
@@ -277,11 +289,8 @@ class MeComVarConvert:
         :return: The read and converted value.
         :rtype: int
         """
-        stream_int = int(stream)
-        stream = "{:02X}".format(stream_int)
-
-        rsp_format = "!B"
-        return unpack(rsp_format, bytes.fromhex(stream))[0]
+        # The payload is parsed as a decimal number, as the device sends it
+        return _UINT8.unpack(bytes.fromhex("{:02X}".format(int(stream))))[0]
 
     def read_uint8(self, stream: str) -> int:
         """
@@ -292,8 +301,7 @@ class MeComVarConvert:
         :return: The read and converted value.
         :rtype: int
         """
-        rsp_format = "!B"
-        return unpack(rsp_format, bytes.fromhex(stream))[0]
+        return _UINT8.unpack(bytes.fromhex(stream))[0]
 
     def read_int16(self, stream: str) -> str:
         """
@@ -304,8 +312,7 @@ class MeComVarConvert:
         :return: The read and converted value.
         :rtype: str
         """
-        rsp_format = "!h"
-        return unpack(rsp_format, bytes.fromhex(stream))[0]
+        return _INT16.unpack(bytes.fromhex(stream))[0]
 
     def read_uint16(self, stream: str) -> str:
         """
@@ -316,8 +323,7 @@ class MeComVarConvert:
         :return: The read and converted value.
         :rtype: str
         """
-        rsp_format = "!H"
-        return unpack(rsp_format, bytes.fromhex(stream))[0]
+        return _UINT16.unpack(bytes.fromhex(stream))[0]
 
     def read_int32(self, stream: str) -> int:
         """
@@ -328,8 +334,7 @@ class MeComVarConvert:
         :return: The read and converted value.
         :rtype: int
         """
-        rsp_format = "!i"
-        return unpack(rsp_format, bytes.fromhex(stream))[0]
+        return _INT32.unpack(bytes.fromhex(stream))[0]
 
     def read_uint32(self, stream: str) -> bytes:
         """
@@ -340,8 +345,7 @@ class MeComVarConvert:
         :return: The read and converted value.
         :rtype: str
         """
-        rsp_format = "!I"
-        return unpack(rsp_format, bytes.fromhex(stream))[0]
+        return _UINT32.unpack(bytes.fromhex(stream))[0]
 
     def read_float32(self, stream) -> float:
         """
@@ -352,8 +356,7 @@ class MeComVarConvert:
         :return: The read and converted value.
         :rtype: float
         """
-        rsp_format = "!f"
-        return unpack(rsp_format, bytes.fromhex(stream))[0]
+        return _FLOAT32.unpack(bytes.fromhex(stream))[0]
 
     def read_int64(self, stream) -> bytes:
         """
@@ -364,8 +367,7 @@ class MeComVarConvert:
         :return: The read and converted value.
         :rtype: str
         """
-        rsp_format = "!q"
-        return unpack(rsp_format, bytes.fromhex(stream))[0]
+        return _INT64.unpack(bytes.fromhex(stream))[0]
 
     def read_uint64(self, stream) -> bytes:
         """
@@ -376,8 +378,7 @@ class MeComVarConvert:
         :return: The read and converted value.
         :rtype: str
         """
-        rsp_format = "!Q"
-        return unpack(rsp_format, bytes.fromhex(stream))[0]
+        return _UINT64.unpack(bytes.fromhex(stream))[0]
 
     def read_double64(self, stream) -> bytes:
         """
@@ -388,8 +389,7 @@ class MeComVarConvert:
         :return: The read and converted value.
         :rtype: str
         """
-        rsp_format = "!d"
-        return unpack(rsp_format, bytes.fromhex(stream))[0]
+        return _DOUBLE64.unpack(bytes.fromhex(stream))[0]
 
     def convert_to_dec(self, hex_value: str):
         """
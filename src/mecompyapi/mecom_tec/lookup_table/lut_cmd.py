@@ -1,7 +1,7 @@
 import os
 import logging
 import time
-from typing import List
+from typing import List, Dict, Callable
 
 from mecompyapi.mecom_tec.lookup_table.lut_record import LutRecord
 from mecompyapi.mecom_tec.lookup_table.lut_status import LutStatus, LutServerResponse
@@ -15,6 +15,125 @@ from mecompyapi.mecom_core.mecom_basic_cmd import MeComBasicCmd
 from mecompyapi.phy_wrapper.mecom_phy_serial_port import MeComPhySerialPort
 
 
+def _enumerate_field1(field1_map: Dict[str, int], field1: str) -> int:
+    """
+    Look up the Field1 enumeration value for an instruction.
+
+    :param field1_map: Field1 names mapped to their enumeration values.
+    :type field1_map: Dict[str, int]
+    :param field1: Field1 name as written in the .csv file.
+    :type field1: str
+    :raises LutException:
+    :return:
+    :rtype: int
+    """
+    try:
+        return field1_map[field1]
+    except KeyError:
+        raise LutException(f"Error in Field1 Enumeration : {field1}")
+
+
+def _enumerate_table_info(record: LutRecord, field1: str, field2: str) -> None:
+    record.instruction = LUT_TABLE_INFO_INSTR
+    record.field1 = _enumerate_field1(field1_map=_TABLE_INFO_F1, field1=field1)
+    record.field2_int = int(field2)
+
+
+def _enumerate_sin_ramp_to(record: LutRecord, field1: str, field2: str) -> None:
+    record.instruction = LUT_SIN_RAMP_TO_INSTR
+    record.field1 = _enumerate_field1(field1_map=_SIN_RAMP_TO_F1, field1=field1)
+    record.field2_float = float(field2)
+
+
+def _enumerate_repeat_mark(record: LutRecord, field1: str, field2: str) -> None:
+    record.instruction = LUT_REPEAT_MARK_INSTR
+    record.field1 = _enumerate_field1(field1_map=_REPEAT_MARK_F1, field1=field1)
+
+
+def _enumerate_lin_ramp_time(record: LutRecord, field1: str, field2: str) -> None:
+    record.instruction = LUT_LIN_RAMP_TIME_INSTR
+    f1_temp = int(field1)
+    if not LUT_LIN_RAMP_TIME_F1_MIN <= f1_temp <= LUT_F1_MAX:
+        raise LutException(f"LIN_RAMP_TIME Field1 out of range : {f1_temp}")
+    record.field1 = f1_temp
+    record.field2_float = float(field2)
+
+
+def _enumerate_status(record: LutRecord, field1: str, field2: str) -> None:
+    record.instruction = LUT_STATUS_INSTR
+    record.field1 = _enumerate_field1(field1_map=_STATUS_F1, field1=field1)
+
+
+def _enumerate_wait(record: LutRecord, field1: str, field2: str) -> None:
+    record.instruction = LUT_WAIT_INSTR
+    if field1 == "FOREVER":
+        record.field1 = LUT_WAIT_F1_FOREVER
+    elif field1 == "TIME":
+        record.field1 = LUT_WAIT_F1_TIME
+        f2_temp = int(field2)
+        if f2_temp < 0:
+            raise LutException(f"WAIT TIME Field2 out of range : {f2_temp}")
+        record.field2_int = f2_temp
+    else:
+        raise LutException(f"Error in Field1 Enumeration : {field1}")
+
+
+def _enumerate_set_float(record: LutRecord, field1: str, field2: str) -> None:
+    record.instruction = LUT_SET_FLOAT_INSTR
+    f1_temp = int(field1)  # need to confirm operation
+    if not 0 <= f1_temp <= LUT_F1_MAX:
+        raise LutException(f"SET_FLOAT Field1 out of range : {f1_temp}")
+    record.field1 = f1_temp  # need to confirm operation
+    record.field2_int = int(field2)  # need to confirm operation
+
+
+def _enumerate_set_int(record: LutRecord, field1: str, field2: str) -> None:
+    record.instruction = LUT_SET_INT_INSTR
+    f1_temp = int(field1)  # need to confirm operation
+    if not 0 <= f1_temp <= LUT_F1_MAX:
+        raise LutException(f"SET_INT Field1 out of range : {f1_temp}")
+    record.field1 = f1_temp  # need to confirm operation
+    record.field2_int = int(field2)  # need to confirm operation
+
+
+def _enumerate_till_temp_stable(record: LutRecord, field1: str, field2: str) -> None:
+    record.instruction = LUT_WAIT_TILL_STABLE_INSTR
+
+
+def _enumerate_set_target_inst(record: LutRecord, field1: str, field2: str) -> None:
+    record.instruction = LUT_CHANGE_TARGET_INST_INSTR
+    record.field2_int = int(field2)  # need to confirm operation
+
+
+def _enumerate_eof(record: LutRecord, field1: str, field2: str) -> None:
+    record.instruction = LUT_EOF_INSTR
+
+
+_TABLE_INFO_F1: Dict[str, int] = {"START": LUT_TABLE_INFO_F1_START, "END": LUT_TABLE_INFO_F1_END}
+_SIN_RAMP_TO_F1: Dict[str, int] = {"FROM_ACT": LUT_SIN_RAMP_TO_F1_FROM_ACT, "FROM_NOM": LUT_SIN_RAMP_TO_F1_FROM_NOM}
+_REPEAT_MARK_F1: Dict[str, int] = {"START": LUT_REPEAT_MARK_F1_START, "END": LUT_REPEAT_MARK_F1_END}
+_STATUS_F1: Dict[str, int] = {"DISABLE": LUT_STATUS_F1_DISABLE, "ENABLE": LUT_STATUS_F1_ENABLE}
+
+# Enum members keyed by value, a plain dict lookup instead of the Enum call machinery
+_LUT_STATUS_MAP: Dict[int, LutStatus] = {m.value: m for m in LutStatus}
+_LUT_SERVER_RESPONSE_MAP: Dict[int, LutServerResponse] = {m.value: m for m in LutServerResponse}
+
+# Maps the instruction name of a .csv line to the function filling in the LutRecord
+_INSTRUCTION_DISPATCH: Dict[str, Callable[[LutRecord, str, str], None]] = {
+    "TABLE_INFO": _enumerate_table_info,
+    "SIN_RAMP_TO": _enumerate_sin_ramp_to,
+    "REPEAT_MARK": _enumerate_repeat_mark,
+    "LIN_RAMP_TIME": _enumerate_lin_ramp_time,
+    "STATUS": _enumerate_status,
+    "WAIT": _enumerate_wait,
+    "SET_FLOAT": _enumerate_set_float,
+    "SET_INT": _enumerate_set_int,
+    "TILL_TEMP_STABLE": _enumerate_till_temp_stable,
+    "SET_TARGET_INST": _enumerate_set_target_inst,
+    "EOF": _enumerate_eof,
+}
+
+
 class LutCmd(object):
     """
     Lookup Table commands (only supported for TEC Controllers)
@@ -29,6 +148,7 @@ class LutCmd(object):
         """
         self.mequery_set = mecom_query_set
         self.mecom_basic_cmd = MeComBasicCmd(mequery_set=mecom_query_set)
+        self.mecom_var_convert: MeComVarConvert = MeComVarConvert()
 
     def download_lookup_table(self, address: int, filepath: str) -> None:
         """
@@ -50,11 +170,17 @@ class LutCmd(object):
         # Split the list into separate lists holding 32 entries each
         lists = self._split_list(list_input=records, max_list_size=32)
 
-        # Create a payload for each list of records and send them to the device
-        for list_ in lists:
-            index_of_list_ = lists.index(list_)
+        # Create a payload for each list of records up front, so that no frame is
+        # built while the device waits for the next page
+        page_frames: List[MeComPacket] = [
+            self._build_page_frame(address=address, list_lut_record=list_, page_offset=index_of_list_)
+            for index_of_list_, list_ in enumerate(lists)
+        ]
+
+        # Send the pages to the device one after the other
+        for tx_frame in page_frames:
             # Check whether the device is ready to receive the next page
-            self._download_page(address=address, list_lut_record=list_, page_offset=index_of_list_)
+            self._download_page(address=address, tx_frame=tx_frame)
 
         # Send the signal to start analyzing the lookup table on the device
         self._start_analyze_and_wait(address=address)
@@ -70,7 +196,7 @@ class LutCmd(object):
         :return: True if the query was successful, False if Device MeComPacket was denied
         :return: bool
         """
-        mecom_var_convert = MeComVarConvert()
+        mecom_var_convert: MeComVarConvert = self.mecom_var_convert
         try:
             tx_frame = MeComPacket(control="#", address=address)
             tx_frame.payload = mecom_var_convert.add_string(tx_frame.payload, "?LT")
@@ -85,7 +211,7 @@ class LutCmd(object):
             # 2 = New Data accepted
             # 3 = Error
             status = mecom_var_convert.read_uint4(rx_frame.payload)
-            logging.info(f"?LT Do Analyze Server Response : {LutServerResponse(status)}")
+            logging.info("?LT Do Analyze Server Response : %s", _LUT_SERVER_RESPONSE_MAP[status])
             return status == LUT_FLASH_STATUS_IDLE
         except LutException as e:
             raise LutException(f"Lookup table test failed: Address: {address}; Detail: {e}")
@@ -100,7 +226,7 @@ class LutCmd(object):
         :return:
         :rtype: int
         """
-        mecom_var_convert = MeComVarConvert()
+        mecom_var_convert: MeComVarConvert = self.mecom_var_convert
         try:
             tx_frame = MeComPacket(control="#", address=address)
             tx_frame.payload = (
@@ -125,11 +251,15 @@ class LutCmd(object):
         :type address: int
         :param instance: Device Instance/Channel.
         :type instance: int
+        :raises LutException: When the device returns an unknown status value.
         :return: LutStatus Enum value
         :rtype: LutStatus
         """
         status = self.mecom_basic_cmd.get_int32_value(address=address, parameter_id=52002, instance=instance)
-        return LutStatus(status)
+        try:
+            return _LUT_STATUS_MAP[status]
+        except KeyError:
+            raise LutException(f"Unknown Lookup Table Status: Address: {address}; Value: {status}")
 
     def start_lookup_table(self, address: int, instance: int) -> None:
         """
@@ -213,9 +343,9 @@ class LutCmd(object):
         else:
             raise LutException("NrOfRepetitions value range is 0 ... 100_000!")
 
-    def _download_page(self, address: int, list_lut_record: List[LutRecord], page_offset: int) -> None:
+    def _build_page_frame(self, address: int, list_lut_record: List[LutRecord], page_offset: int) -> MeComPacket:
         """
-        Downloads a page of the lookup table to the device.
+        Builds the ?LT Program frame for a page of the lookup table.
 
         :param address: Device Address. Use null to use the DefaultDeviceAddress
             defined on MeComQuerySet.
@@ -224,45 +354,56 @@ class LutCmd(object):
         :type list_lut_record: List[LutRecord]
         :param page_offset: The offset of the page.
         :type page_offset: int
+        :return: The frame holding the page, ready to be sent.
+        :rtype: MeComPacket
+        """
+        mecom_var_convert: MeComVarConvert = self.mecom_var_convert
+        tx_frame: MeComPacket = MeComPacket(control="#", address=address)
+        tx_frame.payload = (
+            mecom_var_convert.add_string(tx_frame.payload, "?LT")
+        )  # Start payload with Lookup Table command, '?LT' is used for write and read
+        tx_frame.payload = (
+            mecom_var_convert.add_uint4(tx_frame.payload, 1)
+        )  # 0 = Status Query, 1 = Program, 2 = Do Analyze
+        tx_frame.payload = mecom_var_convert.add_uint32(tx_frame.payload, page_offset)  # Lookup Table Page Offset
+
+        # Add bytearray generated from List[LutRecord]
+        lut_record_bytearray: bytes = b"".join(record.get_bytes() for record in list_lut_record)
+        tx_frame.payload = mecom_var_convert.add_byte_array(stream=tx_frame.payload, value=lut_record_bytearray)
+
+        # Fill the rest of the payload with UINT4 bytes with the value '0' up
+        # until the payload is 524 UINT4 bytes long. This is so that the payload
+        # is always 256 UINT8 bytes large when sent to the device.
+        tx_frame.payload = tx_frame.payload.ljust(524, "0")
+
+        return tx_frame
+
+    def _download_page(self, address: int, tx_frame: MeComPacket) -> None:
+        """
+        Downloads a page of the lookup table to the device.
+
+        :param address: Device Address. Use null to use the DefaultDeviceAddress
+            defined on MeComQuerySet.
+        :type address: int
+        :param tx_frame: The page frame built by _build_page_frame().
+        :type tx_frame: MeComPacket
         :return: None
         """
-        mecom_var_convert: MeComVarConvert = MeComVarConvert()
+        mecom_var_convert: MeComVarConvert = self.mecom_var_convert
         try:
-            tx_frame: MeComPacket = MeComPacket(control="#", address=address)
-            tx_frame.payload = (
-                mecom_var_convert.add_string(tx_frame.payload, "?LT")
-            )  # Start payload with Lookup Table command, '?LT' is used for write and read
-            tx_frame.payload = (
-                mecom_var_convert.add_uint4(tx_frame.payload, 1)
-            )  # 0 = Status Query, 1 = Program, 2 = Do Analyze
-            tx_frame.payload = mecom_var_convert.add_uint32(tx_frame.payload, page_offset)  # Lookup Table Page Offset
-
-            # Add bytearray generated from List[LutRecord]
-            count: int = len(list_lut_record)
-            lut_record_bytearray = bytearray(b"")
-            for i in range(count):
-                lut_record_bytearray.extend(list_lut_record[i].get_bytes())
-            tx_frame.payload = mecom_var_convert.add_byte_array(stream=tx_frame.payload, value=lut_record_bytearray)
-
-            # Fill the rest of the payload with UINT4 bytes with the value '0' up
-            # until the payload is 524 UINT4 bytes long. This is so that the payload
-            # is always 256 UINT8 bytes large when sent to the device.
-            payload_length = len(tx_frame.payload)
-            if payload_length < 524:  # 524
-                for i in range(524 - payload_length):
-                    tx_frame.payload = mecom_var_convert.add_uint4(tx_frame.payload, value=0)
-
-            timeout: int = 0
+            # Back off exponentially from 1 ms up to 20 ms within a 500 ms budget
+            delay: float = 0.001
+            start_time: float = time.monotonic()
             while True:
                 rx_frame: MeComPacket = self.mequery_set.set(tx_frame=tx_frame)
                 status: int = mecom_var_convert.read_uint4(rx_frame.payload)
-                logging.info(f"?LT Program Server Response : {LutServerResponse(status)}")
+                logging.info("?LT Program Server Response : %s", _LUT_SERVER_RESPONSE_MAP[status])
 
                 if status != LUT_FLASH_STATUS_DATA_ACCEPTED:
                     # Manage device busy
-                    timeout += 1
-                    if timeout < 50:
-                        time.sleep(0.010)
+                    if time.monotonic() - start_time < 0.5:
+                        time.sleep(delay)
+                        delay = min(delay * 2, 0.020)
                     else:
                         raise LutException(f"Device Busy while sending Lookup Table")
                 else:
@@ -279,15 +420,17 @@ class LutCmd(object):
         :type address: int
         :return: None
         """
-        timeout: int = 0
+        # Back off exponentially from 1 ms up to 20 ms within a 500 ms budget
+        delay: float = 0.001
+        start_time: float = time.monotonic()
         while True:
             # Send LUT analyze query
             successfully_started: bool = self.start_analyze_lut(address=address)
-            logging.info(f"successfully_started : {successfully_started}")
+            logging.info("successfully_started : %s", successfully_started)
             if successfully_started is not True:
-                timeout += 1
-                if timeout < 50:
-                    time.sleep(0.010)
+                if time.monotonic() - start_time < 0.5:
+                    time.sleep(delay)
+                    delay = min(delay * 2, 0.020)
                 else:
                     raise LutException(f"Device Busy while trying to analyze Lookup Table")
             else:
@@ -360,11 +503,7 @@ class LutCmd(object):
         :return: List holding the split up lists.
         :rtype: List[List[LutRecord]]
         """
-        list_ = []
-        count: int = len(list_input)
-        for i in range(0, count, max_list_size):
-            list_.append(list_input[i:i + min(max_list_size, count - i)])
-        return list_
+        return [list_input[i:i + max_list_size] for i in range(0, len(list_input), max_list_size)]
 
     def _parse_lut_into_list(self, reader: str) -> List[LutRecord]:
         """
@@ -375,23 +514,14 @@ class LutCmd(object):
         :rtype: List[LutRecord]
         """
         with open(reader) as f:
-            # splits by line, but keeps the \n
-            lines = list(f)
-        logging.info(lines)
-
-        list_: List[LutRecord] = []
-        line_count: int = 0
-        for line in lines:
-            if line_count == 0:
-                if "Instruction;Field 1;Field 2" not in lines[0]:
-                    raise LutException(f"The Title of the .csv file must be 'Instruction;Field 1;Field 2'")
-                line_count += 1
-            else:
-                record: LutRecord = self._enumerate_lut(line=line, line_count=line_count)
-                list_.append(record)
-                line_count += 1
-
-        return list_
+            # Iterate the file handle directly, the lines keep the \n
+            header: str = next(f, "")
+            if "Instruction;Field 1;Field 2" not in header:
+                raise LutException(f"The Title of the .csv file must be 'Instruction;Field 1;Field 2'")
+            return [
+                self._enumerate_lut(line=line, line_count=line_count)
+                for line_count, line in enumerate(f, start=1)
+            ]
 
     def _enumerate_lut(self, line: str, line_count: int) -> LutRecord:
         """
@@ -410,94 +540,12 @@ class LutCmd(object):
 
         record = LutRecord()
 
-        try:
-            if instruction == "TABLE_INFO":
-                record.instruction = LUT_TABLE_INFO_INSTR
-                if field1 == "START":
-                    record.field1 = LUT_TABLE_INFO_F1_START
-                elif field1 == "END":
-                    record.field1 = LUT_TABLE_INFO_F1_END
-                else:
-                    raise LutException(f"Error in Field1 Enumeration : {field1}")
-                record.field2_int = int(field2)
-
-            elif instruction == "SIN_RAMP_TO":
-                record.instruction = LUT_SIN_RAMP_TO_INSTR
-                if field1 == "FROM_ACT":
-                    record.field1 = LUT_SIN_RAMP_TO_F1_FROM_ACT
-                elif field1 == "FROM_NOM":
-                    record.field1 = LUT_SIN_RAMP_TO_F1_FROM_NOM
-                else:
-                    raise LutException(f"Error in Field1 Enumeration : {field1}")
-                record.field2_float = float(field2)
-
-            elif instruction == "REPEAT_MARK":
-                record.instruction = LUT_REPEAT_MARK_INSTR
-                if field1 == "START":
-                    record.field1 = LUT_REPEAT_MARK_F1_START
-                elif field1 == "END":
-                    record.field1 = LUT_REPEAT_MARK_F1_END
-                else:
-                    raise LutException(f"Error in Field1 Enumeration : {field1}")
-
-            elif instruction == "LIN_RAMP_TIME":
-                record.instruction = LUT_LIN_RAMP_TIME_INSTR
-                f1_temp = int(field1)
-                if 10 >= f1_temp >= 16_777_216:
-                    record.field1 = f1_temp
-                record.field2_float = float(field2)
-
-            elif instruction == "STATUS":
-                record.instruction = LUT_STATUS_INSTR
-                if field1 == "DISABLE":
-                    record.field1 = LUT_STATUS_F1_DISABLE
-                elif field1 == "ENABLE":
-                    record.field1 = LUT_STATUS_F1_ENABLE
-                else:
-                    raise LutException(f"Error in Field1 Enumeration : {field1}")
-
-            elif instruction == "WAIT":
-                record.instruction = LUT_WAIT_INSTR
-                if field1 == "FOREVER":
-                    record.field1 = LUT_WAIT_F1_FOREVER
-                elif field1 == "TIME":
-                    record.field1 = LUT_WAIT_F1_TIME
-                    f2_temp = int(field2)
-                    if f2_temp >= 0:
-                        record.field2_int = f2_temp
-
-            elif instruction == "SET_FLOAT":
-                record.instruction = LUT_SET_FLOAT_INSTR
-                f1temp_1 = int(field1)  # need to confirm operation
-                if 0 <= f1temp_1 <= 16_777_216:
-                    record.field1 = f1temp_1  # need to confirm operation
-                record.field2_int = int(field2)  # need to confirm operation
-
-            elif instruction == "SET_INT":
-                record.instruction = LUT_SET_INT_INSTR
-                f1temp_2 = int(field1)  # need to confirm operation
-                if 0 <= f1temp_2 <= 16_777_216:
-                    record.field1 = f1temp_2  # need to confirm operation
-                record.field2_int = int(field2)  # need to confirm operation
-
-            elif instruction == "TILL_TEMP_STABLE":
-                record.instruction = LUT_WAIT_TILL_STABLE_INSTR
-
-            elif instruction == "SET_TARGET_INST":
-                record.instruction = LUT_CHANGE_TARGET_INST_INSTR
-                record.field2_int = int(field2)  # need to confirm operation
-
-            elif instruction == "EOF":
-                record.instruction = LUT_EOF_INSTR
-
-            else:
-                raise LutException(f"Error in Instruction Enumeration : {instruction}")
-
-        except LutException as e:
-            raise LutException("Error on line {have to implement}")  # need to fully implement
+        enumerate_instruction = _INSTRUCTION_DISPATCH.get(instruction)
+        if enumerate_instruction is None:
+            raise LutException(f"Error in Instruction Enumeration on line {line_count} : {instruction}")
+        enumerate_instruction(record, field1, field2)
 
-        finally:
-            return record
+        return record
 
 
 if __name__ == "__main__":
@@ -10,6 +10,7 @@ LUT_REPEAT_MARK_INSTR: int = 2
 LUT_REPEAT_MARK_F1_START: int = 0
 LUT_REPEAT_MARK_F1_END: int = 1
 LUT_LIN_RAMP_TIME_INSTR: int = 3
+LUT_LIN_RAMP_TIME_F1_MIN: int = 10
 LUT_STATUS_INSTR: int = 4
 LUT_STATUS_F1_DISABLE: int = 0
 LUT_STATUS_F1_ENABLE: int = 2
@@ -21,3 +22,4 @@ LUT_SET_INT_INSTR: int = 7
 LUT_WAIT_TILL_STABLE_INSTR: int = 8
 LUT_CHANGE_TARGET_INST_INSTR: int = 9
 LUT_EOF_INSTR: int = 254
+LUT_F1_MAX: int = 16_777_216
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from struct import pack
 
 
@@ -9,6 +9,15 @@ class LutRecord(object):
     an Instruction that takes up 8 bits, a Field1 that takes up 24 bits
     and a Field2 that takes up 32 bits (can be an int or a float).
     """
+    __slots__ = (
+        "_instruction",
+        "_field1", "_field1b0", "_field1b1", "_field1b2",
+        "_instruction_and_field_1",
+        "_field2", "_field2_b0", "_field2_b1", "_field2_b2", "_field2_b3",
+        "_field2_int", "_field2_int_b0", "_field2_int_b1", "_field2_int_b2", "_field2_int_b3",
+        "_field2_float", "_field2_float_b0", "_field2_float_b1", "_field2_float_b2", "_field2_float_b3",
+        "_bytes",
+    )
 
     def __init__(self):
         # Instruction value
@@ -47,12 +56,17 @@ class LutRecord(object):
         self._field2_float_b2: int = 0
         self._field2_float_b3: int = 0
 
+        # Serialized record, built on the first get_bytes() call and
+        # cleared whenever one of the fields changes
+        self._bytes: Optional[bytes] = None
+
     @property
     def instruction(self):
         return self._instruction
 
     @instruction.setter
     def instruction(self, new_value):
+        self._bytes = None
         self._instruction = new_value
         self._instruction_and_field_1 = (
             int(self.instruction | self._field1b0 << 8 | self._field1b1 << 16 | self._field1b2 << 24)
@@ -64,6 +78,7 @@ class LutRecord(object):
 
     @field1.setter
     def field1(self, new_value):
+        self._bytes = None
         self._field1 = new_value
         self._field1b0: int = self.field1 & 0x0000FF
         self._field1b1: int = (self.field1 & 0x00FF00) >> 8
@@ -79,6 +94,7 @@ class LutRecord(object):
 
     @field1b0.setter
     def field1b0(self, new_value):
+        self._bytes = None
         self._field1b0 = new_value
         self._field1 = int(self.field1b0 | self._field1b1 << 8 | self._field1b2 << 16)
 
@@ -88,6 +104,7 @@ class LutRecord(object):
 
     @field1b1.setter
     def field1b1(self, new_value):
+        self._bytes = None
         self._field1b1 = new_value
         self._field1 = int(self._field1b0 | self.field1b1 << 8 | self._field1b2 << 16)
 
@@ -97,6 +114,7 @@ class LutRecord(object):
 
     @field1b2.setter
     def field1b2(self, new_value):
+        self._bytes = None
         self._field1b2 = new_value
         self._field1 = int(self._field1b0 | self._field1b1 << 8 | self.field1b2 << 16)
 
@@ -106,6 +124,7 @@ class LutRecord(object):
 
     @field2_int.setter
     def field2_int(self, new_value):
+        self._bytes = None
         self._field2_int = new_value
         self._field2_int_b0: int = self.field2_int & 0x000000FF
         self._field2_int_b1: int = (self.field2_int & 0x0000FF00) >> 8
@@ -125,6 +144,7 @@ class LutRecord(object):
 
     @field2_float.setter
     def field2_float(self, new_value):
+        self._bytes = None
         self._field2_float = new_value
 
         bytes_ = pack('f', self.field2_float)
@@ -153,26 +173,22 @@ class LutRecord(object):
         """
         return [self._instruction_and_field_1, self._field2]
 
-    def get_bytes(self) -> bytearray:
+    def get_bytes(self) -> bytes:
         """
-        This will return the whole LutG1Record object as a byte array.
-        The whole object uses 64-bit, therefore there will be 8 bytes in the array.
+        This will return the whole LutG1Record object as bytes.
+        The whole object uses 64-bit, therefore there will be 8 bytes.
+
+        The bytes are cached until one of the fields is changed.
 
-        :return: LutG1Record split into byte array.
-        :rtype: bytearray
+        :return: LutG1Record split into bytes.
+        :rtype: bytes
         """
-        bytearray_ = bytearray(b"")
-        bytearray_.append(self.instruction)
-        bytearray_.append(self._field1b0)
-        bytearray_.append(self._field1b1)
-        bytearray_.append(self._field1b2)
-
-        bytearray_.append(self._field2_b0)
-        bytearray_.append(self._field2_b1)
-        bytearray_.append(self._field2_b2)
-        bytearray_.append(self._field2_b3)
-        
-        return bytearray_
+        if self._bytes is None:
+            self._bytes = bytes((
+                self.instruction, self._field1b0, self._field1b1, self._field1b2,
+                self._field2_b0, self._field2_b1, self._field2_b2, self._field2_b3
+            ))
+        return self._bytes
 
     def set_bytes(self, buffer: bytearray):
         """
@@ -1,3 +1,4 @@
+import threading
 from abc import ABC, abstractmethod
 
 
@@ -28,38 +29,72 @@ class IntMeComPhy(ABC):
     The physical interface which implements this interface must already be open, 
     before you can use functions of this interface.
     """
+    __slots__ = ("lock",)
+
     def __init__(self):
-        pass
+        # Held by the transport layer for each whole transaction, so the channels and
+        # threads sharing this interface cannot interleave their frames on the wire
+        self.lock: threading.RLock = threading.RLock()
 
     @abstractmethod
-    def send_string(self, stream: str):
+    def send_string(self, stream: bytes) -> None:
         """
         Sends data to the physical interface.
 
         :param stream: The whole content of the Stream is sent to the physical interface.
-        :type stream: str
+        :type stream: bytes
+        :return: None
         """
         raise NotImplementedError
 
     @abstractmethod
-    def get_data_or_timeout(self):
+    def get_data_or_timeout(self) -> bytes:
         """
         Tries to read data from the physical interface or throws a timeout exception.
         
-        Reads the available data in the physical interface buffer and returns immediately. 
-        If the receiving buffer is empty, it tries to read at least one byte. 
-        It will wait till the timeout occurs if nothing is received.
-        Must probably be called several times to receive the whole frame.
+        Reads from the physical interface until a whole frame, terminated by a carriage
+        return, has been received. Bytes received after the carriage return are kept
+        for the next call.
+        Throws a timeout exception if the frame is not complete before the timeout.
 
         :raises MeComPhyInterfaceException: Thrown when the underlying physical interface
             is not OK.
         :raises MeComPhyTimeoutException: Thrown when 0 bytes were received during the
             specified timeout time.
+        :return: The received bytes, without the terminating carriage return.
+        :rtype: bytes
         """
         raise NotImplementedError
 
+    def transact(self, stream: bytes) -> bytes:
+        """
+        Sends data to the physical interface and reads the answer in one call.
+
+        Implementations can override this to fuse the write and the read.
+
+        :param stream: The whole content of the Stream is sent to the physical interface.
+        :type stream: bytes
+        :raises MeComPhyInterfaceException: Thrown when the underlying physical interface
+            is not OK.
+        :raises MeComPhyTimeoutException: Thrown when 0 bytes were received during the
+            specified timeout time.
+        :return: The received bytes, without the terminating carriage return.
+        :rtype: bytes
+        """
+        self.send_string(stream=stream)
+        return self.get_data_or_timeout()
+
+    def discard_pending_input(self) -> None:
+        """
+        Requests that received data which has not been read yet is discarded
+        before the next send, e.g. late answers of a failed transaction.
+
+        :return: None
+        """
+        pass
+
     @abstractmethod
-    def change_speed(self, baudrate: int):
+    def change_speed(self, baudrate: int) -> None:
         """
         Used to change the Serial Speed in case of serial communication interfaces.
 
@@ -69,7 +104,7 @@ class IntMeComPhy(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def set_timeout(self, milliseconds: int):
+    def set_timeout(self, milliseconds: int) -> None:
         """
         Used to modify the standard timeout of the physical interface.
 
@@ -13,14 +13,49 @@ class MeComPhyFtdi(IntMeComPhy):
     """
     Implements the IMeComPhy interface for the FTDI chip drivers.
     """
-    def __init__(self):
+    __slots__ = ("ftdi", "_rx_residual", "_timeout_s", "_needs_purge", "_use_event_char", "_latency_ms")
+
+    _CR: bytes = b"\r"
+    _PURGE_MASK: int = ftd2xx.ftd2xx.defines.PURGE_RX | ftd2xx.ftd2xx.defines.PURGE_TX
+    _PURGE_RX_MASK: int = ftd2xx.ftd2xx.defines.PURGE_RX
+    # USB IN transfer size in bytes. Must be a multiple of 64, MeCom answers easily fit into 256 bytes.
+    _USB_IN_TRANSFER_SIZE: int = 256
+
+    def __init__(self, *, use_event_char: bool = True, latency_ms: int = 1):
         """
         Implements the IMeComPhy interface for the FTDI chip drivers.
+
+        :param use_event_char: If True, the chip flushes its receive buffer to the host as soon as the frame
+            terminating carriage return arrives, instead of waiting for the latency timer.
+        :type use_event_char: bool
+        :param latency_ms: Default FTDI latency timer in milliseconds (1 ... 255).
+        :type latency_ms: int
+        :raises MeComPhyInterfaceException: When the latency is out of range.
         """
         super().__init__()
+        self._check_latency(latency_ms=latency_ms)
+        self._use_event_char: bool = use_event_char
+        self._latency_ms: int = latency_ms
         self.ftdi: Optional[ftd2xx.FTD2XX] = None
+        self._rx_residual: bytearray = bytearray()
+        self._timeout_s: float = 1.0
+        # Set when a receive failed, so stale bytes of the failed answer are purged before the next send
+        self._needs_purge: bool = False
 
-    def mecom_set_default_settings(self, baudrate: int, timeout: int):
+    @staticmethod
+    def _check_latency(latency_ms: int) -> None:
+        """
+        Checks the FTDI latency timer value.
+
+        :param latency_ms: FTDI latency timer in milliseconds.
+        :type latency_ms: int
+        :raises MeComPhyInterfaceException: When the latency is out of range.
+        :return: None
+        """
+        if not 1 <= latency_ms <= 255:
+            raise MeComPhyInterfaceException(f"FTDI latency timer value range is 1 ... 255 ms, got {latency_ms}!")
+
+    def mecom_set_default_settings(self, baudrate: int, timeout: int, latency_ms: Optional[int] = None):
         """
         Initializes the FTDI default settings, so that is it usually running
         with Meerstetter products.
@@ -31,7 +66,15 @@ class MeComPhyFtdi(IntMeComPhy):
         :type baudrate: int
         :param timeout: Time in seconds for read timeout. If timeout happens, read returns empty string.
         :type timeout: int
+        :param latency_ms: FTDI latency timer in milliseconds. Small frames are held back in the
+            chip for up to this long. Valid range is 1 ... 255, values below 1 are illegal.
+            None uses the value given to the constructor.
+        :type latency_ms: Optional[int]
+        :raises MeComPhyInterfaceException: When the latency is out of range.
         """
+        if latency_ms is None:
+            latency_ms = self._latency_ms
+        self._check_latency(latency_ms=latency_ms)
         self.ftdi.setBaudRate(baud=baudrate)
         self.ftdi.setDataCharacteristics(
             wordlen=ftd2xx.ftd2xx.defines.BITS_8,
@@ -40,12 +83,24 @@ class MeComPhyFtdi(IntMeComPhy):
         )
         self.ftdi.setFlowControl(flowcontrol=ftd2xx.ftd2xx.defines.FLOW_NONE, xon=0, xoff=0)
         self.ftdi.setTimeouts(read=timeout * 1000, write=timeout * 1000)
-        self.ftdi.setLatencyTimer(latency=3)
+        self._timeout_s = timeout
+        self.ftdi.setLatencyTimer(latency=latency_ms)
+        # Small USB transfers so the driver does not wait to fill the default 4 KiB request
+        self.ftdi.setUSBParameters(in_tx_size=self._USB_IN_TRANSFER_SIZE)
+        if self._use_event_char:
+            # Flush the receive buffer to the host as soon as the frame terminating
+            # carriage return arrives, instead of waiting for the latency timer
+            self.ftdi.setChars(evch=0x0D, evch_en=1, erch=0, erch_en=0)
+        else:
+            self.ftdi.setChars(evch=0, evch_en=0, erch=0, erch_en=0)
         # Purges receive and transmit buffer in the device
-        self.ftdi.purge(mask=ftd2xx.ftd2xx.defines.PURGE_RX | ftd2xx.ftd2xx.defines.PURGE_TX)
+        self.ftdi.purge(mask=self._PURGE_MASK)
+        self._rx_residual.clear()
+        self._needs_purge = False
 
     def connect(
-            self, id_str: Optional[str] = None, dev_id: int = 0, baudrate: int = 57_600, timeout: int = 1
+            self, id_str: Optional[str] = None, dev_id: int = 0, baudrate: int = 57_600, timeout: int = 1,
+            latency_ms: Optional[int] = None
     ) -> None:
         """
         Open a handle to an usb device by serial number(default), description or
@@ -60,6 +115,9 @@ class MeComPhyFtdi(IntMeComPhy):
         :type baudrate: int
         :param timeout: Time in seconds for read timeout. If timeout happens, read returns empty string.
         :type timeout: int
+        :param latency_ms: FTDI latency timer in milliseconds (1 ... 255). None uses the value given to the
+            constructor.
+        :type latency_ms: Optional[int]
         :return: None
         """
         if id_str is not None:
@@ -68,7 +126,7 @@ class MeComPhyFtdi(IntMeComPhy):
         else:
             self.ftdi: ftd2xx.FTD2XX = ftd2xx.open(dev=dev_id)
 
-        self.mecom_set_default_settings(baudrate=baudrate, timeout=timeout)
+        self.mecom_set_default_settings(baudrate=baudrate, timeout=timeout, latency_ms=latency_ms)
 
     def tear(self) -> None:
         """
@@ -78,72 +136,139 @@ class MeComPhyFtdi(IntMeComPhy):
         :return: None
         """
         # Purges receive and transmit buffer in the device
-        self.ftdi.purge(mask=ftd2xx.ftd2xx.defines.PURGE_RX | ftd2xx.ftd2xx.defines.PURGE_TX)
+        self.ftdi.purge(mask=self._PURGE_MASK)
         self.ftdi.close()
 
-    def send_string(self, stream: str) -> None:
+    def send_string(self, stream: bytes) -> None:
         """
         Sends data to the physical interface.
 
         :param stream: The whole content of the Stream is sent to the physical interface.
-        :type stream: str
+        :type stream: bytes
+        :raises MeComPhyInterfaceException: When the stream could not be written completely.
         :return: None
         """
-        # Purges receive and transmit buffer in the device
-        self.ftdi.purge(mask=ftd2xx.ftd2xx.defines.PURGE_RX | ftd2xx.ftd2xx.defines.PURGE_TX)
+        if self._needs_purge:
+            # Drop whatever is left of the answer to the failed transaction
+            self.ftdi.purge(mask=self._PURGE_RX_MASK)
+            self._rx_residual.clear()
+            self._needs_purge = False
+        written: int = self.ftdi.write(data=stream)
+        if written != len(stream):
+            raise MeComPhyInterfaceException(
+                f"Write timed out: {written} of {len(stream)} bytes sent"
+            )
 
-        stream_bytes: bytes = stream.encode()
+    def get_data_or_timeout(self) -> bytes:
+        """
+        Tries to read data from the physical interface or throws a timeout exception.
 
-        self.ftdi.write(data=stream_bytes)
+        Reads from the physical interface until a whole frame, terminated by a carriage
+        return, has been received. Bytes received after the carriage return are kept
+        for the next call.
+        Throws a timeout exception if the frame is not complete before the timeout.
 
-    def get_data_or_timeout(self) -> str:
+        :raises MeComPhyInterfaceException: Thrown when the underlying physical interface
+            is not OK.
+        :raises MeComPhyTimeoutException: Thrown when 0 bytes were received during the
+            specified timeout time.
+        :return: The received bytes, without the terminating carriage return.
+        :rtype: bytes
         """
-        Tries to read data from the physical interface or throws a timeout exception.
+        return self._read_until_cr()
 
-        Reads the available data in the physical interface buffer and returns immediately.
-        If the receiving buffer is empty, it tries to read at least one byte.
-        It will wait till the timeout occurs if nothing is received.
-        Must probably be called several times to receive the whole frame.
+    def transact(self, stream: bytes) -> bytes:
+        """
+        Sends data to the physical interface and reads the answer in one call.
 
+        :param stream: The whole content of the Stream is sent to the physical interface.
+        :type stream: bytes
         :raises MeComPhyInterfaceException: Thrown when the underlying physical interface
             is not OK.
         :raises MeComPhyTimeoutException: Thrown when 0 bytes were received during the
             specified timeout time.
-        :return:
-        :rtype: str
+        :return: The received bytes, without the terminating carriage return.
+        :rtype: bytes
+        """
+        self.send_string(stream=stream)
+        return self._read_until_cr()
+
+    def _read_until_cr(self) -> bytes:
+        """
+        Reads from the FTDI receive queue until a carriage return is received.
+
+        :raises MeComPhyInterfaceException:
+        :raises MeComPhyTimeoutException:
+        :return: The received bytes, without the terminating carriage return.
+        :rtype: bytes
         """
-        # Wait for FTDI receive queue to receive characters from the instrument
-        time.sleep(0.1)
-        num_bytes_available: int = self.ftdi.getQueueStatus()
-        logging.debug(f"num_bytes_available : {num_bytes_available}")
         try:
-            to_read: int = 1 if num_bytes_available == 0 else num_bytes_available
-            read_bytes: bytes = self.ftdi.read(nchars=to_read)
-            logging.debug(f"read_bytes : {read_bytes}")
-            if read_bytes == b"":
-                raise MeComPhyTimeoutException("The FTDI queue returned an empty byte.")
-            response_frame: bytes = read_bytes.rstrip(b"\r")
-            logging.debug(f"response_frame : {response_frame}")
-            return response_frame.decode()
+            # Bytes received after a previous frame's carriage return are kept in
+            # the residual buffer and form the start of this frame
+            rx_buffer: bytearray = self._rx_residual
+            cr: bytes = self._CR
+            read = self.ftdi.read
+            get_queue_status = self.ftdi.getQueueStatus
+            deadline: float = time.monotonic() + self._timeout_s
+            # Bytes before scan_from are known to contain no carriage return
+            scan_from: int = 0
+            while True:
+                cr_index: int = rx_buffer.find(cr, scan_from)
+                if cr_index >= 0:
+                    response_frame: bytes = bytes(rx_buffer[:cr_index])
+                    del rx_buffer[:cr_index + 1]
+                    logging.debug("response_frame : %r", response_frame)
+                    return response_frame
+
+                # Wait for FTDI receive queue to receive characters from the instrument
+                num_bytes_available: int = get_queue_status()
+                while num_bytes_available == 0:
+                    if time.monotonic() >= deadline:
+                        raise MeComPhyTimeoutException("The FTDI queue did not receive any bytes before the timeout.")
+                    time.sleep(0.0005)
+                    num_bytes_available: int = get_queue_status()
+                logging.debug("num_bytes_available : %d", num_bytes_available)
+
+                # Read everything that is queued
+                read_bytes: bytes = read(nchars=num_bytes_available)
+                logging.debug("read_bytes : %r", read_bytes)
+                if read_bytes == b"":
+                    raise MeComPhyTimeoutException("The FTDI queue returned an empty byte.")
+                scan_from = len(rx_buffer)
+                rx_buffer.extend(read_bytes)
         except MeComPhyTimeoutException as e:
+            self._needs_purge = True
             raise e
         except Exception as e:
+            self._needs_purge = True
             raise MeComPhyInterfaceException(f"Failure during receiving: {e}")
 
-    def change_speed(self, baudrate: int):
+    def discard_pending_input(self) -> None:
+        """
+        Requests that received data which has not been read yet is discarded
+        before the next send, e.g. late answers of a failed transaction.
+
+        :return: None
+        """
+        self._needs_purge = True
+
+    def change_speed(self, baudrate: int) -> None:
         """
         Used to change the Serial Speed in case of serial communication interfaces.
 
         :param baudrate: Baud Rate for the Serial Interface.
         :type baudrate: int
+        :return: None
         """
-        raise NotImplementedError
+        self.ftdi.setBaudRate(baud=baudrate)
 
-    def set_timeout(self, milliseconds: int):
+    def set_timeout(self, milliseconds: int) -> None:
         """
         Used to modify the standard timeout of the physical interface.
 
-        :param milliseconds:
+        :param milliseconds: Read and write timeout in milliseconds.
         :type milliseconds: int
+        :return: None
         """
-        raise NotImplementedError
+        self.ftdi.setTimeouts(read=milliseconds, write=milliseconds)
+        self._timeout_s = milliseconds / 1000
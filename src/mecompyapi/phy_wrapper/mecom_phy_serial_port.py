@@ -1,3 +1,9 @@
+import logging
+import os
+import select
+import time
+from typing import Optional, Union
+
 from serial import Serial, SerialException, SerialTimeoutException
 
 from mecompyapi.phy_wrapper.int_mecom_phy import (
@@ -5,22 +11,25 @@ from mecompyapi.phy_wrapper.int_mecom_phy import (
 )
 
 
-class ResponseException(Exception):
-    def __init__(self, message):
-        super().__init__(message)
-
-
-class ResponseTimeout(ResponseException):
-    pass
+class MeComPhySerialPort(IntMeComPhy):
+    __slots__ = ("ser", "_fd", "_rx_residual", "_rx_chunk", "_needs_purge")
 
+    _CR: bytes = b"\r"
+    _READ_CHUNK_SIZE: int = 4096
+    _DRIVER_BUFFER_SIZE: int = 65536
 
-class MeComPhySerialPort(IntMeComPhy):
     def __init__(self):
         """
         Implements the IMeComPhy interface for the Serial Port interface.
         """
         super().__init__()
         self.ser: Serial = Serial()
+        self._fd: Optional[int] = None
+        self._rx_residual: bytearray = bytearray()
+        # Preallocated scratch buffer the POSIX read path reads into, so no bytes object is created per read
+        self._rx_chunk: memoryview = memoryview(bytearray(self._READ_CHUNK_SIZE))
+        # Set when a receive failed, so stale bytes of the failed answer are discarded before the next send
+        self._needs_purge: bool = False
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.ser.__exit__(exc_type, exc_val, exc_tb)
@@ -32,12 +41,13 @@ class MeComPhySerialPort(IntMeComPhy):
         """
         Opens the SerialPort with the standard settings used to communicate with ME devices.
 
-        :param port_name:
+        :param port_name: Port, as described in connect.
         :type port_name: str
-        :param baud_rate:
+        :param baud_rate: The baud rate setting.
         :type baud_rate: int
+        :return: None
         """
-        raise NotImplementedError
+        self.connect(port_name=port_name, baudrate=baud_rate)
 
     def connect(self, port_name: str, timeout: int = 1, baudrate: int = 57600) -> None:
         """
@@ -64,9 +74,54 @@ class MeComPhySerialPort(IntMeComPhy):
                 self.ser.open()
             except SerialException as e:
                 raise e
+            # clear buffers
+            self.ser.reset_output_buffer()
+            self.ser.reset_input_buffer()
+            self._rx_residual.clear()
+            self._needs_purge = False
+            self._enable_low_latency()
+            self._enlarge_driver_buffers()
+            # On POSIX the port can be waited on with select and drained with a single os.read,
+            # other platforms go through pyserial
+            self._fd = self.ser.fileno() if os.name == "posix" else None
         else:
             raise MeComPhyInterfaceException("Serial device is already open!")
 
+    def _enable_low_latency(self) -> None:
+        """
+        Sets the ASYNC_LOW_LATENCY flag on Linux, so that the kernel hands received bytes
+        over immediately instead of with the USB serial driver's default latency.
+
+        Ports that do not support the flag (e.g. pseudo terminals) are left unchanged.
+
+        :return: None
+        """
+        if not hasattr(self.ser, "set_low_latency_mode"):
+            # pyserial only implements this on Linux
+            return
+        try:
+            self.ser.set_low_latency_mode(True)
+        except (ValueError, OSError) as e:
+            logging.debug("low latency mode not available on %s : %s", self.ser.port, e)
+
+    def _enlarge_driver_buffers(self) -> None:
+        """
+        Asks the Windows serial driver for larger receive and transmit buffers, so that the
+        answers to a whole pipelined batch fit into the driver buffer and are drained with
+        one read call.
+
+        Other platforms use the kernel's tty buffers and are left unchanged.
+
+        :return: None
+        """
+        if not hasattr(self.ser, "set_buffer_size"):
+            # pyserial only implements this on Windows
+            return
+        try:
+            self.ser.set_buffer_size(rx_size=self._DRIVER_BUFFER_SIZE, tx_size=self._DRIVER_BUFFER_SIZE)
+        except (ValueError, OSError, SerialException) as e:
+            logging.debug("buffer size not changed on %s : %s", self.ser.port, e)
+
     def tear(self) -> None:
         """
         Tear should always be called when the instrument is being disconnected. It should
@@ -77,89 +132,129 @@ class MeComPhySerialPort(IntMeComPhy):
         self.ser.flush()
         self.ser.close()
 
-    def _read(self, size) -> bytes:
-        """
-        Read n=size bytes from serial, if <n bytes are received (serial.read() return because of timeout),
-        raise a timeout.
-
-        :return:
-        :rtype: bytes
-        """
-        recv: bytes = self.ser.read(size=size)
-        if len(recv) < size:
-            raise ResponseTimeout("timeout because serial read returned less bytes than expected")
-        else:
-            return recv
-
-    def send_string(self, stream: str) -> None:
+    def send_string(self, stream: bytes) -> None:
         """
         Sends data to the physical interface.
 
         :param stream: The whole content of the Stream is sent to the physical interface.
-        :type stream: str
+        :type stream: bytes
         :return: None
         """
-        # clear buffers
-        self.ser.reset_output_buffer()
-        self.ser.reset_input_buffer()
-
-        stream_bytes: bytes = stream.encode()
+        if self._needs_purge:
+            # Drop whatever is left of the answer to the failed transaction
+            self.ser.reset_input_buffer()
+            self._rx_residual.clear()
+            self._needs_purge = False
 
-        # send query
-        self.ser.write(stream_bytes)
+        # Send the whole stream (one frame or a pipelined batch) with a single write. The answer is
+        # read right after, so there is no need to wait for the driver to drain its transmit buffer.
+        self.ser.write(stream)
 
-        # flush write cache
-        self.ser.flush()
-
-    def get_data_or_timeout(self) -> str:
+    def get_data_or_timeout(self) -> bytes:
         """
         Tries to read data from the physical interface or throws a timeout exception.
 
-        Reads the available data in the physical interface buffer and returns immediately.
-        If the receiving buffer is empty, it tries to read at least one byte.
-        It will wait till the timeout occurs if nothing is received.
-        Must probably be called several times to receive the whole frame.
+        Reads from the physical interface until a whole frame, terminated by a carriage
+        return, has been received. Bytes received after the carriage return are kept
+        for the next call.
+        Throws a timeout exception if the frame is not complete before the timeout.
 
         :raises MeComPhyInterfaceException: Thrown when the underlying physical interface
             is not OK.
         :raises MeComPhyTimeoutException: Thrown when 0 bytes were received during the
             specified timeout time.
-        :return:
-        :rtype: str
+        :return: The received bytes, without the terminating carriage return.
+        :rtype: bytes
         """
         try:
-            # initialize response and carriage return
-            cr: bytes = "\r".encode()
-            response_frame: bytes = b''
-            response_byte: bytes = self._read(size=1)  # read one byte at a time, timeout is set on instance level
-
-            # read until stop byte
-            while response_byte != cr:
-                response_frame += response_byte
-                response_byte: bytes = self._read(size=1)
-
-            return response_frame.decode()
+            # Bytes received after a previous frame's carriage return are kept in
+            # the residual buffer and form the start of this frame
+            rx_buffer: bytearray = self._rx_residual
+            cr: bytes = self._CR
+            timeout: Optional[float] = self.ser.timeout
+            deadline: Optional[float] = None if timeout is None else time.monotonic() + timeout
+            # Bytes before scan_from are known to contain no carriage return
+            scan_from: int = 0
+            while True:
+                cr_index: int = rx_buffer.find(cr, scan_from)
+                if cr_index >= 0:
+                    response_frame: bytes = bytes(rx_buffer[:cr_index])
+                    del rx_buffer[:cr_index + 1]
+                    return response_frame
+
+                remaining: Optional[float] = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise MeComPhyTimeoutException(
+                            "timeout because serial read returned before the carriage return was received"
+                        )
+                scan_from = len(rx_buffer)
+                rx_buffer.extend(self._read_available(timeout=remaining))
+
+        except MeComPhyTimeoutException as e:
+            self._needs_purge = True
+            raise e
 
         except SerialTimeoutException as e:
+            self._needs_purge = True
             raise MeComPhyTimeoutException(e)
 
         except Exception as e:
+            self._needs_purge = True
             raise MeComPhyInterfaceException(f"Failure during receiving: {e}")
 
-    def change_speed(self, baudrate: int):
+    def _read_available(self, timeout: Optional[float]) -> Union[bytes, memoryview]:
+        """
+        Waits until the serial port has received data and returns everything that is available.
+
+        :param timeout: Time in seconds to wait for data. None waits forever.
+        :type timeout: Optional[float]
+        :raises MeComPhyInterfaceException: When the port reports readable but returns no data.
+        :return: The received bytes, empty if nothing arrived before the timeout. On POSIX this is a view
+            into the scratch buffer which is only valid until the next read.
+        :rtype: Union[bytes, memoryview]
+        """
+        fd: Optional[int] = self._fd
+        if fd is None:
+            return self.ser.read(self.ser.in_waiting or 1)
+
+        readable, _, _ = select.select([fd], [], [], timeout)
+        if not readable:
+            return b""
+        rx_chunk: memoryview = self._rx_chunk
+        num_bytes_read: int = os.readv(fd, [rx_chunk])
+        if num_bytes_read == 0:
+            # select reported the port as readable but no data came, the device was most likely disconnected
+            raise MeComPhyInterfaceException("device reports readiness to read but returned no data")
+        return rx_chunk[:num_bytes_read]
+
+    def discard_pending_input(self) -> None:
+        """
+        Requests that received data which has not been read yet is discarded
+        before the next send, e.g. late answers of a failed transaction.
+
+        :return: None
+        """
+        self._needs_purge = True
+
+    def change_speed(self, baudrate: int) -> None:
         """
         Used to change the Serial Speed in case of serial communication interfaces.
 
-        :param baudrate:
+        :param baudrate: The baud rate setting.
         :type baudrate: int
+        :return: None
         """
-        raise NotImplementedError
+        self.ser.baudrate = baudrate
 
-    def set_timeout(self, milliseconds: int):
+    def set_timeout(self, milliseconds: int) -> None:
         """
         Used to modify the standard timeout of the physical interface.
 
-        :param milliseconds:
+        :param milliseconds: Read and write timeout in milliseconds.
         :type milliseconds: int
+        :return: None
         """
-        raise NotImplementedError
+        self.ser.timeout = milliseconds / 1000
+        self.ser.write_timeout = milliseconds / 1000
@@ -1,10 +1,15 @@
 import os
+import asyncio
 import logging
 import time
 import datetime
-import statistics
-from enum import Enum
-from typing import Tuple, List, Optional
+import math
+import threading
+from array import array
+from collections import deque
+from dataclasses import dataclass, fields
+from enum import IntEnum
+from typing import Tuple, List, Dict, Optional, Union
 
 from mecompyapi.mecom_core.mecom_query_set import MeComQuerySet
 from mecompyapi.mecom_core.mecom_basic_cmd import MeComBasicCmd
@@ -18,18 +23,21 @@ from mecompyapi.mecom_tec.lookup_table.lut_status import LutStatus
 from mecompyapi.mecom_tec.lookup_table.lut_exception import LutException
 
 
+logger: logging.Logger = logging.getLogger(__name__)
+
+
 class TimeoutException(Exception):
     def __init__(self, message):
         super().__init__(message)
 
 
-class TemperatureStability(Enum):
+class TemperatureStability(IntEnum):
     NOT_ACTIVE = 0  # Temperature regulation is not active
     NOT_STABLE = 1  # Is not stable
     STABLE = 2  # Is stable
 
 
-class DeviceStatus(Enum):
+class DeviceStatus(IntEnum):
     INIT = 0
     READY = 1
     RUN = 2
@@ -38,30 +46,30 @@ class DeviceStatus(Enum):
     DEVICE_WILL_RESET_WITHIN_NEXT_200_MS = 5
 
 
-class ControlInputSelection(Enum):
+class ControlInputSelection(IntEnum):
     STATIC_CURRENT_VOLTAGE = 0  # Static Current/Voltage
     LIVE_CURRENT_VOLTAGE = 1  # Live Current/Voltage
     TEMPERATURE_CONTROLLER = 2  # Temperature Controller
 
 
-class GeneralOperatingMode(Enum):
+class GeneralOperatingMode(IntEnum):
     SINGLE = 0  # Single (Independent)
     PARALLEL_INDIVIDUAL_LOADS = 1  # Parallel (CH1 -> CH2); Individual Loads
     PARALLEL_COMMON_LOAD = 2  # Parallel (CH1 -> CH2); Common Load
 
 
-class ThermalRegulationMode(Enum):
+class ThermalRegulationMode(IntEnum):
     PELTIER_FULL_CONTROL = 0  # Peltier, Full Control
     PELTIER_HEAT_ONLY_COOL_ONLY = 1  # Peltier, Heat Only - Cool Only
     RESISTOR_HEAT_ONLY = 2  # Resistor, Heat Only
 
 
-class PositiveCurrentIs(Enum):
+class PositiveCurrentIs(IntEnum):
     COOLING = 0
     HEATING = 1
 
 
-class ObjectSensorType(Enum):
+class ObjectSensorType(IntEnum):
     UNKNOWN_TYPE = 0
     PT100 = 1
     PT1000 = 2
@@ -72,14 +80,14 @@ class ObjectSensorType(Enum):
     VIN1 = 7
 
 
-class OutputStageEnable(Enum):
+class OutputStageEnable(IntEnum):
     STATIC_OFF = 0
     STATIC_ON = 1
     LIVE_OFF_ON = 2
     HW_ENABLE = 3
 
 
-class LookupTableStatus(Enum):
+class LookupTableStatus(IntEnum):
     NOT_INITIALIZED = 0
     TABLE_DATA_NOT_VALID = 1
     ANALYZING_DATA_TABLE = 2
@@ -89,12 +97,12 @@ class LookupTableStatus(Enum):
     SUB_TABLE_NOT_FOUND = 6
 
 
-class SaveToFlashState(Enum):
+class SaveToFlashState(IntEnum):
     ENABLED = 0
     DISABLED = 1  # all parameters are now RAM parameters
 
 
-class FlashStatus(Enum):
+class FlashStatus(IntEnum):
     ALL_SAVED_TO_FLASH = 0
     """
     All Parameters are saved to Flash
@@ -110,6 +118,224 @@ class FlashStatus(Enum):
     """
 
 
+# Value to member lookup tables, used instead of calling the Enum constructor on every response
+_TEMPERATURE_STABILITY_MAP: Dict[int, TemperatureStability] = {m.value: m for m in TemperatureStability}
+_DEVICE_STATUS_MAP: Dict[int, DeviceStatus] = {m.value: m for m in DeviceStatus}
+_CONTROL_INPUT_SELECTION_MAP: Dict[int, ControlInputSelection] = {m.value: m for m in ControlInputSelection}
+_GENERAL_OPERATING_MODE_MAP: Dict[int, GeneralOperatingMode] = {m.value: m for m in GeneralOperatingMode}
+_THERMAL_REGULATION_MODE_MAP: Dict[int, ThermalRegulationMode] = {m.value: m for m in ThermalRegulationMode}
+_POSITIVE_CURRENT_IS_MAP: Dict[int, PositiveCurrentIs] = {m.value: m for m in PositiveCurrentIs}
+_OBJECT_SENSOR_TYPE_MAP: Dict[int, ObjectSensorType] = {m.value: m for m in ObjectSensorType}
+_OUTPUT_STAGE_ENABLE_MAP: Dict[int, OutputStageEnable] = {m.value: m for m in OutputStageEnable}
+_SAVE_TO_FLASH_STATE_MAP: Dict[int, SaveToFlashState] = {m.value: m for m in SaveToFlashState}
+_FLASH_STATUS_MAP: Dict[int, FlashStatus] = {m.value: m for m in FlashStatus}
+
+
+@dataclass
+class TecSnapshot:
+    """
+    Monitoring values of one channel, read with a single pipelined transaction.
+
+    :param object_temperature: The object temperature in units of degC.
+    :type object_temperature: float
+    :param sink_temperature: The sink temperature in units of degC.
+    :type sink_temperature: float
+    :param setpoint_temperature: The target object temperature in units of degC.
+    :type setpoint_temperature: float
+    :param output_current: The actual output current in units of Amps (A).
+    :type output_current: float
+    :param output_voltage: The actual output voltage in units of Volts (V).
+    :type output_voltage: float
+    :param pid_control_variable: The PID control variable as a percentage (%).
+    :type pid_control_variable: float
+    """
+    object_temperature: float
+    sink_temperature: float
+    setpoint_temperature: float
+    output_current: float
+    output_voltage: float
+    pid_control_variable: float
+
+
+@dataclass
+class TecTelemetry:
+    """
+    Temperatures, output and stability of one channel, read with a single pipelined transaction.
+
+    :param object_temperature: The object temperature in units of degC.
+    :type object_temperature: float
+    :param setpoint_temperature: The target object temperature in units of degC.
+    :type setpoint_temperature: float
+    :param output_current: The actual output current in units of Amps (A).
+    :type output_current: float
+    :param output_voltage: The actual output voltage in units of Volts (V).
+    :type output_voltage: float
+    :param device_temperature: The device temperature in units of degC.
+    :type device_temperature: float
+    :param temperature_stable: True if the temperature is stable.
+    :type temperature_stable: bool
+    """
+    object_temperature: float
+    setpoint_temperature: float
+    output_current: float
+    output_voltage: float
+    device_temperature: float
+    temperature_stable: bool
+
+
+@dataclass
+class TecSettings:
+    """
+    All settings of one channel, as returned by MeerstetterTEC.get_settings().
+
+    :param idn: The identification string, 'Meerstetter,TEC<model>,<serial number>,<hw>,<fw>'.
+    :type idn: str
+    :param device_address: The device address found while connecting.
+    :type device_address: int
+    :param device_type: The device type (i.e. the TEC model number).
+    :type device_type: int
+    :param serial_number: The serial number of the device.
+    :type serial_number: int
+    :param hardware_version: The hardware version of the device.
+    :type hardware_version: int
+    :param firmware_id: The firmware identification string.
+    :type firmware_id: str
+    :param firmware_version: The firmware version of the device.
+    :type firmware_version: int
+    :param device_status: The device status.
+    :type device_status: DeviceStatus
+    :param object_temperature: The object temperature in units of degC.
+    :type object_temperature: float
+    :param setpoint_temperature: The target object temperature in units of degC.
+    :type setpoint_temperature: float
+    :param actual_output_current: The actual output current in units of Amps (A).
+    :type actual_output_current: float
+    :param actual_output_voltage: The actual output voltage in units of Volts (V).
+    :type actual_output_voltage: float
+    :param device_temperature: The device temperature in units of degC.
+    :type device_temperature: float
+    :param input_selection: The control input selection.
+    :type input_selection: ControlInputSelection
+    :param current_limitation: The current limitation in units of Amps (A).
+    :type current_limitation: float
+    :param voltage_limitation: The voltage limitation in units of Volts (V).
+    :type voltage_limitation: float
+    :param current_error_threshold: The current error threshold in units of Amps (A).
+    :type current_error_threshold: float
+    :param voltage_error_threshold: The voltage error threshold in units of Volts (V).
+    :type voltage_error_threshold: float
+    :param general_operating_mode: The general operating mode.
+    :type general_operating_mode: GeneralOperatingMode
+    :param base_baud_rate: The base baud rate of the UART.
+    :type base_baud_rate: int
+    :param uart_response_delay: The UART response delay in units of microseconds (us).
+    :type uart_response_delay: int
+    :param coarse_temp_ramp: The coarse temperature ramp in units of degC/s.
+    :type coarse_temp_ramp: float
+    :param proportional_gain_kp: The proportional gain (Kp).
+    :type proportional_gain_kp: float
+    :param integration_time_ti: The integration time (Ti) in units of seconds (s).
+    :type integration_time_ti: float
+    :param differential_time_td: The differential time (Td) in units of seconds (s).
+    :type differential_time_td: float
+    :param pid_part_damping: The D Part Damping PT1 value.
+    :type pid_part_damping: float
+    :param thermal_regulation_mode: The thermal regulation mode.
+    :type thermal_regulation_mode: ThermalRegulationMode
+    :param positive_current_is: Whether positive current flow causes cooling or heating.
+    :type positive_current_is: PositiveCurrentIs
+    :param object_sensor_type: The object sensor type.
+    :type object_sensor_type: ObjectSensorType
+    :param output_stage_enable: The output stage enable.
+    :type output_stage_enable: OutputStageEnable
+    """
+    idn: str
+    device_address: int
+    device_type: int
+    serial_number: int
+    hardware_version: int
+    firmware_id: str
+    firmware_version: int
+    device_status: DeviceStatus
+    object_temperature: float
+    setpoint_temperature: float
+    actual_output_current: float
+    actual_output_voltage: float
+    device_temperature: float
+    input_selection: ControlInputSelection
+    current_limitation: float
+    voltage_limitation: float
+    current_error_threshold: float
+    voltage_error_threshold: float
+    general_operating_mode: GeneralOperatingMode
+    base_baud_rate: int
+    uart_response_delay: int
+    coarse_temp_ramp: float
+    proportional_gain_kp: float
+    integration_time_ti: float
+    differential_time_td: float
+    pid_part_damping: float
+    thermal_regulation_mode: ThermalRegulationMode
+    positive_current_is: PositiveCurrentIs
+    object_sensor_type: ObjectSensorType
+    output_stage_enable: OutputStageEnable
+
+    def as_dict(self) -> dict:
+        """
+        The settings as a dict keyed by field name, in field order.
+
+        :return:
+        :rtype: dict
+        """
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+
+class _SlidingStdDev:
+    """
+    Sample standard deviation of the last `window` values, updated from running sums over a
+    ring buffer, so each added value costs the same regardless of the window length.
+    """
+    __slots__ = ("window", "_samples", "_reference", "_total", "_total_sq")
+
+    def __init__(self, window: int):
+        """
+        :param window: the number of values the standard deviation is taken over (at least 2)
+        :type window: int
+        """
+        self.window: int = window
+        self._samples: deque = deque(maxlen=window)
+        # Sums of the deviations from the first value, which keeps the variance numerically stable
+        self._reference: Optional[float] = None
+        self._total: float = 0.0
+        self._total_sq: float = 0.0
+
+    def add(self, value: float) -> Optional[float]:
+        """
+        Add a value to the window, dropping the oldest one once the window is full.
+
+        :param value: the new value
+        :type value: float
+        :return: the standard deviation of the window, None while the window is not filled yet
+        :rtype: Optional[float]
+        """
+        if self._reference is None:
+            self._reference = value
+        deviation: float = value - self._reference
+        samples: deque = self._samples
+        window: int = self.window
+        if len(samples) == window:
+            oldest: float = samples[0]
+            self._total -= oldest
+            self._total_sq -= oldest * oldest
+        samples.append(deviation)
+        self._total += deviation
+        self._total_sq += deviation * deviation
+        if len(samples) < window:
+            return None
+        variance: float = (self._total_sq - self._total * self._total / window) / (window - 1)
+        return math.sqrt(max(variance, 0.0))
+
+
 class MeerstetterTEC(object):
     r"""
     Controlling TEC devices via serial.
@@ -118,6 +344,19 @@ class MeerstetterTEC(object):
 
     ./meerstetter/pyMeCom/mecom/commands.py
     """
+    __slots__ = (
+        "phy_com", "mequery_set", "mecom_basic_cmd", "mecom_lut_cmd", "address", "instance",
+        "_const_cache", "_fw_id_str"
+    )
+
+    # Parameter IDs of the get_monitor_data_logger() columns, in column order
+    _MONITOR_PARAMETER_IDS: Tuple[int, ...] = (1000, 1001, 1010, 1011, 1012, 1020, 1021, 1032)
+    _MONITOR_HEADER_LINE: str = (
+        "Time;CH 1 Object Temperature;CH 1 Sink Temperature;CH 1 Target Object Temperature;"
+        "CH 1 (Ramp) Nominal Temperature;CH 1 Thermal Power Model Current;CH 1 Actual Output Current;"
+        "CH 1 Actual Output Voltage;CH 1 PID Control Variable;\n"
+    )
+
     def __init__(self, *args, **kwargs) -> None:
         self.phy_com: Optional[MeComPhySerialPort | MeComPhyFtdi] = None
         self.mequery_set: Optional[MeComQuerySet] = None
@@ -125,6 +364,10 @@ class MeerstetterTEC(object):
         self.mecom_lut_cmd: Optional[LutCmd] = None
         self.address: Optional[int] = None
         self.instance: Optional[int] = None
+        # Identity parameters that cannot change while connected, keyed by parameter ID
+        self._const_cache: Dict[int, int] = {}
+        # Firmware identification string (?IF) of the connected device
+        self._fw_id_str: Optional[str] = None
 
     def connect_serial_port(self, port: str = "COM9", instance: int = 1) -> None:
         """
@@ -145,31 +388,25 @@ class MeerstetterTEC(object):
         :return: None
         """
         self.instance: int = instance
+        self._const_cache.clear()
+        self._fw_id_str = None
 
         self.phy_com: MeComPhySerialPort = MeComPhySerialPort()
         self.phy_com.connect(port_name=port)
 
         mequery_set: MeComQuerySet = MeComQuerySet(phy_com=self.phy_com)
+        self.mequery_set: MeComQuerySet = mequery_set
         self.mecom_basic_cmd: MeComBasicCmd = MeComBasicCmd(mequery_set=mequery_set)
 
         # Get Identification String
         fw_id_str: str = self.get_firmware_identification_string(broadcast=True)
-        logging.debug(f"Connected device firmware identification string (?IF) : {fw_id_str}")
+        logger.debug("Connected device firmware identification string (?IF) : %s", fw_id_str)
+        self._fw_id_str = fw_id_str
 
         self.mecom_lut_cmd = LutCmd(mecom_query_set=mequery_set)
 
-        retries: int = 3
-        for _ in range(retries):
-            try:
-                self.address: int = self.get_device_address()
-                logging.debug(f"connected to {self.address}")
-                return
-            except ComCommandException as e:
-                logging.debug(f"[ComCommandException] : {e}")
-                continue
-        raise ComCommandException(
-            f"Could not successfully query the controller address after {retries} retries..."
-        )
+        self.address: int = self._get_address_with_retries()
+        logger.debug("connected to %s", self.address)
 
     def connect_ftdi(self, id_str: Optional[str] = None, instance: int = 1) -> None:
         """
@@ -183,6 +420,8 @@ class MeerstetterTEC(object):
         :return: None
         """
         self.instance: int = instance
+        self._const_cache.clear()
+        self._fw_id_str = None
 
         self.phy_com: MeComPhyFtdi = MeComPhyFtdi()
 
@@ -190,6 +429,7 @@ class MeerstetterTEC(object):
         mequery_set: MeComQuerySet = (
             MeComQuerySet(phy_com=self.phy_com)
         )
+        self.mequery_set: MeComQuerySet = mequery_set
         self.mecom_basic_cmd: MeComBasicCmd = (
             MeComBasicCmd(mequery_set=mequery_set)
         )
@@ -197,19 +437,115 @@ class MeerstetterTEC(object):
             LutCmd(mecom_query_set=mequery_set)
         )
 
-        retries: int = 3
-        for _ in range(retries):
+        self.address: int = self._get_address_with_retries()
+        logger.debug("connected to %s", self.address)
+
+    def connect_shared(self, mequery_set: MeComQuerySet, instance: int = 1) -> None:
+        """
+        Connect to a channel of a controller whose interface is already open, e.g. the
+        second channel of a two channel device. The channels share the physical interface
+        and the query set, so the port is only opened once.
+
+        The channels may be used from different threads, each transaction holds the lock
+        of the physical interface. Call tear() only once for all channels sharing the interface.
+
+        :param mequery_set: The query set of an already connected MeerstetterTEC.
+        :type mequery_set: MeComQuerySet
+        :param instance:
+        :type instance: int
+        :raises ComCommandException:
+        :return: None
+        """
+        self.instance: int = instance
+        self._const_cache.clear()
+        self._fw_id_str = None
+
+        self.phy_com = mequery_set.phy_com
+        self.mequery_set: MeComQuerySet = mequery_set
+        self.mecom_basic_cmd: MeComBasicCmd = MeComBasicCmd(mequery_set=mequery_set)
+        self.mecom_lut_cmd: LutCmd = LutCmd(mecom_query_set=mequery_set)
+
+        self.address: int = self._get_address_with_retries()
+        logger.debug("connected to %s", self.address)
+
+    def _get_address_with_retries(self, retries: int = 3, backoff: float = 0.05) -> int:
+        """
+        Query the device address, retrying with exponential backoff if the query fails.
+
+        :param retries: Number of attempts.
+        :type retries: int
+        :param backoff: Wait time in seconds after the first failed attempt. It doubles after
+            each further failed attempt.
+        :type backoff: float
+        :raises ComCommandException: When all attempts failed.
+        :return: the device address
+        :rtype: int
+        """
+        for attempt in range(retries):
             try:
-                self.address: int = self.get_device_address()
-                logging.debug(f"connected to {self.address}")
-                return
+                return self.get_device_address()
             except ComCommandException as e:
-                logging.debug(f"[ComCommandException] : {e}")
-                continue
+                logger.debug("[ComCommandException] : %s", e)
+                if attempt < retries - 1:
+                    time.sleep(backoff * (2 ** attempt))
         raise ComCommandException(
             f"Could not successfully query the controller address after {retries} retries..."
         )
 
+    def _get_float_value(self, parameter_id: int) -> float:
+        """
+        Get a FLOAT32 parameter of the channel.
+
+        :param parameter_id: Device Parameter ID.
+        :type parameter_id: int
+        :return: The parameter value.
+        :rtype: float
+        """
+        return self.mecom_basic_cmd.get_float_value(
+            address=self.address, parameter_id=parameter_id, instance=self.instance
+        )
+
+    def _get_int32_value(self, parameter_id: int) -> int:
+        """
+        Get an INT32 parameter of the channel.
+
+        :param parameter_id: Device Parameter ID.
+        :type parameter_id: int
+        :return: The parameter value.
+        :rtype: int
+        """
+        return self.mecom_basic_cmd.get_int32_value(
+            address=self.address, parameter_id=parameter_id, instance=self.instance
+        )
+
+    def _set_float_value(self, parameter_id: int, value: float) -> None:
+        """
+        Set a FLOAT32 parameter of this channel.
+
+        :param parameter_id: Device Parameter ID.
+        :type parameter_id: int
+        :param value: Value to set.
+        :type value: float
+        :return: None
+        """
+        self.mecom_basic_cmd.set_float_value(
+            address=self.address, parameter_id=parameter_id, instance=self.instance, value=value
+        )
+
+    def _set_int32_value(self, parameter_id: int, value: int) -> None:
+        """
+        Set an INT32 parameter of this channel.
+
+        :param parameter_id: Device Parameter ID.
+        :type parameter_id: int
+        :param value: Value to set.
+        :type value: int
+        :return: None
+        """
+        self.mecom_basic_cmd.set_int32_value(
+            address=self.address, parameter_id=parameter_id, instance=self.instance, value=value
+        )
+
     def tear(self) -> None:
         """
         Tear should always be called when the instrument is being disconnected. It should
@@ -217,6 +553,8 @@ class MeerstetterTEC(object):
 
         :return: None
         """
+        self._const_cache.clear()
+        self._fw_id_str = None
         self.phy_com.tear()
 
     def reset(self) -> None:
@@ -225,8 +563,21 @@ class MeerstetterTEC(object):
 
         :return: None
         """
+        self._const_cache.clear()
+        self._fw_id_str = None
         self.mecom_basic_cmd.reset_device(address=self.address, channel=self.instance)
 
+    def refresh_identity(self) -> None:
+        """
+        Discard the cached identity values (device type, hardware version, serial number,
+        firmware version, base baud rate and firmware identification string), e.g. after
+        the device was swapped without reconnecting. They are queried again on next use.
+
+        :return: None
+        """
+        self._const_cache.clear()
+        self._fw_id_str = None
+
     def get_firmware_identification_string(self, broadcast: bool = False) -> str:
         """
         Query the Firmware Identification String of the device.
@@ -237,21 +588,62 @@ class MeerstetterTEC(object):
         The device should only be in broadcast mode during the connection routine. Once
         connected, all methods should use the unique address of the device.
 
+        The string read while connecting is cached, so non-broadcast calls only query
+        the device when nothing is cached yet. The cache is cleared by reset().
+
         :param broadcast: When True, the device will answer independent of its
             unique address.
         :type broadcast: bool
         :return: The firmware identification string of the device.
         :rtype: str
         """
-        logging.debug(f"get the firmware identification string for channel {self.instance}")
+        if not broadcast and self._fw_id_str is not None:
+            return self._fw_id_str
+        logger.debug("get the firmware identification string for channel %s", self.instance)
         address = 0 if broadcast else self.address
         identify: str = (
             self.mecom_basic_cmd.get_ident_string(
                 address=address, channel=self.instance
             )
         )
+        if not broadcast:
+            self._fw_id_str = identify
         return identify
 
+    def _get_int32_cached(self, parameter_id: int) -> int:
+        """
+        Get an INT32 parameter that cannot change while connected. The device is only
+        queried on the first call, later calls return the cached value.
+
+        :param parameter_id: Device Parameter ID.
+        :type parameter_id: int
+        :return: The parameter value.
+        :rtype: int
+        """
+        value: Optional[int] = self._const_cache.get(parameter_id)
+        if value is None:
+            value = self._get_int32_value(parameter_id=parameter_id)
+            self._const_cache[parameter_id] = value
+        return value
+
+    def _get_int32_values_cached(self, parameter_ids: List[int]) -> List[int]:
+        """
+        Get several INT32 parameters that cannot change while connected. The parameters
+        not cached yet are queried with one pipelined transaction.
+
+        :param parameter_ids: The Device Parameter IDs to read.
+        :type parameter_ids: List[int]
+        :return: The parameter values, in the order of the parameter IDs.
+        :rtype: List[int]
+        """
+        missing: List[int] = [parameter_id for parameter_id in parameter_ids if parameter_id not in self._const_cache]
+        if missing:
+            values: List[int] = self.mecom_basic_cmd.get_int32_values(
+                address=self.address, parameters=[(parameter_id, self.instance) for parameter_id in missing]
+            )
+            self._const_cache.update(zip(missing, values))
+        return [self._const_cache[parameter_id] for parameter_id in parameter_ids]
+
     def get_id(self) -> str:
         """
         Query the Identification String of the device.
@@ -261,10 +653,8 @@ class MeerstetterTEC(object):
             Version.
         :rtype: str
         """
-        model: int = self.get_device_type()
-        sn: int = self.get_serial_number()
-        hw: int = self.get_hardware_version()
-        fw: int = self.get_firmware_version()
+        logger.debug("get id for channel %s", self.instance)
+        model, hw, sn, fw = self._get_int32_values_cached(parameter_ids=[100, 101, 102, 103])
         identity: str = f"Meerstetter,TEC{model},{sn},{hw},{fw}"
         return identity
 
@@ -275,11 +665,8 @@ class MeerstetterTEC(object):
         :return: the TEC controller device type identification
         :rtype: int
         """
-        logging.debug(f"get device type for channel {self.instance}")
-        device_type: int = (
-            self.mecom_basic_cmd.get_int32_value(
-                address=self.address, parameter_id=100, instance=self.instance)
-        )
+        logger.debug("get device type for channel %s", self.instance)
+        device_type: int = self._get_int32_cached(parameter_id=100)
         return device_type
 
     def get_hardware_version(self) -> int:
@@ -289,12 +676,8 @@ class MeerstetterTEC(object):
         :return: The hardware version of the device.
         :rtype: int
         """
-        logging.debug(f"get hardware version for channel {self.instance}")
-        hardware_version: int = (
-            self.mecom_basic_cmd.get_int32_value(
-                address=self.address, parameter_id=101, instance=self.instance
-            )
-        )
+        logger.debug("get hardware version for channel %s", self.instance)
+        hardware_version: int = self._get_int32_cached(parameter_id=101)
         return hardware_version
 
     def get_serial_number(self) -> int:
@@ -304,12 +687,8 @@ class MeerstetterTEC(object):
         :return: The serial number of the device.
         :rtype: int
         """
-        logging.debug(f"get serial number for channel {self.instance}")
-        serial_number: int = (
-            self.mecom_basic_cmd.get_int32_value(
-                address=self.address, parameter_id=102, instance=self.instance
-            )
-        )
+        logger.debug("get serial number for channel %s", self.instance)
+        serial_number: int = self._get_int32_cached(parameter_id=102)
         return serial_number
 
     def get_firmware_version(self) -> int:
@@ -319,12 +698,8 @@ class MeerstetterTEC(object):
         :return: The firmware version of the device.
         :rtype: int
         """
-        logging.debug(f"get firmware version for channel {self.instance}")
-        firmware_version: int = (
-            self.mecom_basic_cmd.get_int32_value(
-                address=self.address, parameter_id=103, instance=self.instance
-            )
-        )
+        logger.debug("get firmware version for channel %s", self.instance)
+        firmware_version: int = self._get_int32_cached(parameter_id=103)
         return firmware_version
 
     def get_device_status(self) -> DeviceStatus:
@@ -334,13 +709,9 @@ class MeerstetterTEC(object):
         :return: the active status of the TEC controller
         :rtype: DeviceStatus
         """
-        logging.debug(f"get device status for channel {self.instance}")
-        status_id_int: int = (
-            self.mecom_basic_cmd.get_int32_value(
-                address=self.address, parameter_id=104, instance=self.instance
-            )
-        )
-        status_id: DeviceStatus = DeviceStatus(status_id_int)
+        logger.debug("get device status for channel %s", self.instance)
+        status_id_int: int = self._get_int32_value(parameter_id=104)
+        status_id: DeviceStatus = _DEVICE_STATUS_MAP[status_id_int]
         return status_id
 
     def set_automatic_save_to_flash(self, save_to_flash: SaveToFlashState) -> None:
@@ -351,10 +722,8 @@ class MeerstetterTEC(object):
         :type save_to_flash: SaveToFlashState
         :return: None
         """
-        logging.debug(f"set the automatic save to flash state for channel {self.instance} to {save_to_flash}")
-        self.mecom_basic_cmd.set_int32_value(
-            address=self.address, parameter_id=108, instance=self.instance, value=save_to_flash.value
-        )
+        logger.debug("set the automatic save to flash state for channel %s to %s", self.instance, save_to_flash)
+        self._set_int32_value(parameter_id=108, value=save_to_flash)
 
     def get_automatic_save_to_flash(self) -> SaveToFlashState:
         """
@@ -364,26 +733,18 @@ class MeerstetterTEC(object):
             is enabled or disabled
         :rtype: SaveToFlashState
         """
-        logging.debug(f"get the automatic save to flash state for channel {self.instance}")
-        resp: int = (
-            self.mecom_basic_cmd.get_int32_value(
-                address=self.address, parameter_id=108, instance=self.instance
-            )
-        )
-        save_to_flash_state = SaveToFlashState(int(resp))
+        logger.debug("get the automatic save to flash state for channel %s", self.instance)
+        resp: int = self._get_int32_value(parameter_id=108)
+        save_to_flash_state = _SAVE_TO_FLASH_STATE_MAP[resp]
         return save_to_flash_state
 
     def get_flash_status(self):
         """
 
         """
-        logging.debug(f"get the flash status for channel {self.instance}")
-        resp: int = (
-            self.mecom_basic_cmd.get_int32_value(
-                address=self.address, parameter_id=109, instance=self.instance
-            )
-        )
-        flash_status = FlashStatus(int(resp))
+        logger.debug("get the flash status for channel %s", self.instance)
+        resp: int = self._get_int32_value(parameter_id=109)
+        flash_status = _FLASH_STATUS_MAP[resp]
         return flash_status
 
     def get_temperature(self) -> float:
@@ -393,12 +754,8 @@ class MeerstetterTEC(object):
         :return: The object temperature in units of degrees Celsius (degC).
         :rtype: float
         """
-        logging.debug(f"get object temperature for channel {self.instance}")
-        object_temperature = (
-            self.mecom_basic_cmd.get_float_value(
-                address=self.address, parameter_id=1000, instance=self.instance
-            )
-        )
+        logger.debug("get object temperature for channel %s", self.instance)
+        object_temperature: float = self._get_float_value(parameter_id=1000)
         return object_temperature
 
     def get_sink_temperature(self) -> float:
@@ -408,12 +765,8 @@ class MeerstetterTEC(object):
         :return: The sink temperature in units of degrees Celsius (degC).
         :rtype: float
         """
-        logging.debug(f"get sink temperature for channel {self.instance}")
-        sink_temperature: float = (
-            self.mecom_basic_cmd.get_float_value(
-                address=self.address, parameter_id=1001, instance=self.instance
-            )
-        )
+        logger.debug("get sink temperature for channel %s", self.instance)
+        sink_temperature: float = self._get_float_value(parameter_id=1001)
         return sink_temperature
 
     def get_setpoint_temperature(self) -> float:
@@ -424,12 +777,8 @@ class MeerstetterTEC(object):
             in units of degC
         :rtype: float
         """
-        logging.debug(f"get the setpoint temperature for channel {self.instance}")
-        setpoint: float = (
-            self.mecom_basic_cmd.get_float_value(
-                address=self.address, parameter_id=1010, instance=self.instance
-            )
-        )
+        logger.debug("get the setpoint temperature for channel %s", self.instance)
+        setpoint: float = self._get_float_value(parameter_id=1010)
         return setpoint
 
     def get_ramp_nominal_object_temperature(self) -> float:
@@ -440,12 +789,8 @@ class MeerstetterTEC(object):
             in units of degC
         :rtype: float
         """
-        logging.debug(f"get the (ramp) nominal object temperature for channel {self.instance}")
-        ramp_nominal_temperature: float = (
-            self.mecom_basic_cmd.get_float_value(
-                address=self.address, parameter_id=1011, instance=self.instance
-            )
-        )
+        logger.debug("get the (ramp) nominal object temperature for channel %s", self.instance)
+        ramp_nominal_temperature: float = self._get_float_value(parameter_id=1011)
         return ramp_nominal_temperature
 
     def get_thermal_power_model_current(self) -> float:
@@ -455,10 +800,8 @@ class MeerstetterTEC(object):
         :return: the thermal power model current in units of Amps (A)
         :rtype: float
         """
-        logging.debug(f"get the thermal power model current for channel {self.instance}")
-        current: float = self.mecom_basic_cmd.get_float_value(
-            address=self.address, parameter_id=1012, instance=self.instance
-        )
+        logger.debug("get the thermal power model current for channel %s", self.instance)
+        current: float = self._get_float_value(parameter_id=1012)
         return current
 
     def get_tec_current(self) -> float:
@@ -468,12 +811,8 @@ class MeerstetterTEC(object):
         :return: The output current in units of Amps (A).
         :rtype: float
         """
-        logging.debug(f"get output current for channel {self.instance}")
-        output_current: float = (
-            self.mecom_basic_cmd.get_float_value(
-                address=self.address, parameter_id=1020, instance=self.instance
-            )
-        )
+        logger.debug("get output current for channel %s", self.instance)
+        output_current: float = self._get_float_value(parameter_id=1020)
         return output_current
 
     def get_tec_voltage(self) -> float:
@@ -483,10 +822,8 @@ class MeerstetterTEC(object):
         :return: The output voltage in units of Volts (V).
         :rtype: float
         """
-        logging.debug(f"get output voltage for channel {self.instance}")
-        output_voltage: float = self.mecom_basic_cmd.get_float_value(
-            address=self.address, parameter_id=1021, instance=self.instance
-        )
+        logger.debug("get output voltage for channel %s", self.instance)
+        output_voltage: float = self._get_float_value(parameter_id=1021)
         return output_voltage
 
     def get_pid_control_variable(self) -> float:
@@ -497,14 +834,148 @@ class MeerstetterTEC(object):
         :return: The PID Control Variable as a percentage (%).
         :rtype: float
         """
-        logging.debug(f"get the PID control variable percentage for channel {self.instance}")
-        pid_control_variable: float = (
-            self.mecom_basic_cmd.get_float_value(
-                address=self.address, parameter_id=1032, instance=self.instance
-            )
-        )
+        logger.debug("get the PID control variable percentage for channel %s", self.instance)
+        pid_control_variable: float = self._get_float_value(parameter_id=1032)
         return pid_control_variable
 
+    def get_float_values(self, parameter_ids: List[int]) -> Dict[int, float]:
+        """
+        Get several float parameters of the channel with one pipelined transaction.
+
+        :param parameter_ids: The Device Parameter IDs to read.
+        :type parameter_ids: List[int]
+        :return: The values keyed by parameter ID.
+        :rtype: Dict[int, float]
+        """
+        logger.debug("get float values %s for channel %s", parameter_ids, self.instance)
+        values: List[float] = self.mecom_basic_cmd.get_float_values(
+            address=self.address, parameters=[(parameter_id, self.instance) for parameter_id in parameter_ids]
+        )
+        return dict(zip(parameter_ids, values))
+
+    def snapshot(self) -> TecSnapshot:
+        """
+        Get the object and sink temperature, the setpoint, the output current and voltage
+        and the PID control variable with one pipelined transaction.
+
+        :return: The monitoring values of the channel.
+        :rtype: TecSnapshot
+        """
+        values: Dict[int, float] = self.get_float_values(parameter_ids=[1000, 1001, 1010, 1020, 1021, 1032])
+        return TecSnapshot(
+            object_temperature=values[1000],
+            sink_temperature=values[1001],
+            setpoint_temperature=values[1010],
+            output_current=values[1020],
+            output_voltage=values[1021],
+            pid_control_variable=values[1032]
+        )
+
+    def get_telemetry_snapshot(self) -> TecTelemetry:
+        """
+        Get the object temperature, the setpoint, the output current and voltage, the
+        device temperature and the temperature stability with one pipelined transaction.
+
+        :return: The telemetry values of the channel.
+        :rtype: TecTelemetry
+        """
+        logger.debug("get telemetry snapshot for channel %s", self.instance)
+        (
+            object_temperature, setpoint_temperature, output_current, output_voltage, device_temperature, stability
+        ) = self.mecom_basic_cmd.get_values(
+            address=self.address,
+            parameters=[
+                (1000, self.instance, float), (1010, self.instance, float), (1020, self.instance, float),
+                (1021, self.instance, float), (1063, self.instance, float), (1200, self.instance, int)
+            ]
+        )
+        return TecTelemetry(
+            object_temperature=object_temperature,
+            setpoint_temperature=setpoint_temperature,
+            output_current=output_current,
+            output_voltage=output_voltage,
+            device_temperature=device_temperature,
+            temperature_stable=_TEMPERATURE_STABILITY_MAP[stability] == TemperatureStability.STABLE
+        )
+
+    def stream_telemetry(self, n_samples: int, rate_hz: float = 10.0) -> Dict[str, array]:
+        """
+        Capture the object temperature, the setpoint and the output current and voltage at a
+        fixed rate. Every sample is read with one pipelined transaction and stored in typed
+        arrays, one per value, instead of lists of float objects.
+
+        :param n_samples: Number of samples to capture.
+        :type n_samples: int
+        :param rate_hz: Sample rate in Hz. Sampling is limited by the link if it cannot keep up.
+        :type rate_hz: float
+        :raises ValueError: If n_samples is negative or rate_hz is not positive.
+        :return: The sample times in seconds since the start and the values, keyed by
+            "time", "object_temperature", "setpoint_temperature", "output_current" and "output_voltage".
+        :rtype: Dict[str, array]
+        """
+        if n_samples < 0:
+            raise ValueError(f"n_samples must not be negative : {n_samples}")
+        if rate_hz <= 0:
+            raise ValueError(f"rate_hz must be positive : {rate_hz}")
+        names: Tuple[str, ...] = ("object_temperature", "setpoint_temperature", "output_current", "output_voltage")
+        parameters: List[Tuple[int, int]] = [(parameter_id, self.instance) for parameter_id in (1000, 1010, 1020, 1021)]
+        columns: List[array] = [array("d", bytes(8 * n_samples)) for _ in range(len(names) + 1)]
+        times: array = columns[0]
+        get_float_values = self.mecom_basic_cmd.get_float_values
+        period: float = 1.0 / rate_hz
+
+        start_time: float = time.perf_counter()
+        next_sample: float = start_time
+        for i in range(n_samples):
+            times[i] = time.perf_counter() - start_time
+            for column, value in zip(columns[1:], get_float_values(address=self.address, parameters=parameters)):
+                column[i] = value
+            next_sample += period
+            if i + 1 < n_samples:
+                time.sleep(max(0.0, next_sample - time.perf_counter()))
+        return dict(zip(("time",) + names, columns))
+
+    async def get_float_values_async(self, parameter_ids: List[int]) -> Dict[int, float]:
+        """
+        Awaitable version of get_float_values(). The transaction runs in a worker thread, so
+        several controllers on separate ports can be polled concurrently with asyncio.gather().
+
+        :param parameter_ids: The Device Parameter IDs to read.
+        :type parameter_ids: List[int]
+        :return: The values keyed by parameter ID.
+        :rtype: Dict[int, float]
+        """
+        return await asyncio.to_thread(self.get_float_values, parameter_ids)
+
+    async def snapshot_async(self) -> TecSnapshot:
+        """
+        Awaitable version of snapshot(). The transaction runs in a worker thread, so
+        several controllers on separate ports can be polled concurrently with asyncio.gather().
+
+        :return: The monitoring values of the channel.
+        :rtype: TecSnapshot
+        """
+        return await asyncio.to_thread(self.snapshot)
+
+    async def get_telemetry_snapshot_async(self) -> TecTelemetry:
+        """
+        Awaitable version of get_telemetry_snapshot(). The transaction runs in a worker thread.
+        Channels sharing one port can be gathered too, their transactions take turns on the port lock.
+
+        :return: The telemetry values of the channel.
+        :rtype: TecTelemetry
+        """
+        return await asyncio.to_thread(self.get_telemetry_snapshot)
+
+    async def get_temperature_async(self) -> float:
+        """
+        Awaitable version of get_temperature(). The query runs in a worker thread.
+
+        :return: the object temperature in units of degC
+        :rtype: float
+        """
+        return await asyncio.to_thread(self.get_temperature)
+
     def get_device_temperature(self) -> float:
         """
         Get the temperature of the TEC controller device.
@@ -512,11 +983,8 @@ class MeerstetterTEC(object):
         :return: The TEC controller temperature in units of degrees Celsius (degC).
         :rtype: float
         """
-        logging.debug(f"get the device temperature for channel {self.instance}")
-        device_temp: float = (
-            self.mecom_basic_cmd.get_float_value(
-                address=self.address, parameter_id=1063, instance=self.instance)
-        )
+        logger.debug("get the device temperature for channel %s", self.instance)
+        device_temp: float = self._get_float_value(parameter_id=1063)
         return device_temp
 
     def is_temperature_stable(self) -> bool:
@@ -526,13 +994,9 @@ class MeerstetterTEC(object):
         :return: True if the temperature is stable, False otherwise
         :rtype: bool
         """
-        resp: int = (
-            self.mecom_basic_cmd.get_int32_value(
-                address=self.address, parameter_id=1200, instance=self.instance
-            )
-        )
-        stability = TemperatureStability(int(resp))
-        logging.debug(f"Temperature Stability: {stability.name}")
+        resp: int = self._get_int32_value(parameter_id=1200)
+        stability = _TEMPERATURE_STABILITY_MAP[resp]
+        logger.debug("Temperature Stability: %s", stability.name)
         return stability == TemperatureStability.STABLE
 
     def set_input_selection(self, input_selection: ControlInputSelection) -> None:
@@ -543,10 +1007,8 @@ class MeerstetterTEC(object):
         :type input_selection: ControlInputSelection
         :return: None
         """
-        logging.debug(f"set the input selection for channel {self.instance} to {input_selection}")
-        self.mecom_basic_cmd.set_int32_value(
-            address=self.address, parameter_id=2000, instance=self.instance, value=input_selection.value
-        )
+        logger.debug("set the input selection for channel %s to %s", self.instance, input_selection)
+        self._set_int32_value(parameter_id=2000, value=input_selection)
 
     def get_input_selection(self) -> ControlInputSelection:
         """
@@ -555,11 +1017,9 @@ class MeerstetterTEC(object):
         :return: the output control input selection for the TEC controller
         :rtype: ControlInputSelection
         """
-        logging.debug(f"get the input selection for channel {self.instance}")
-        resp: int = self.mecom_basic_cmd.get_int32_value(
-            address=self.address, parameter_id=2000, instance=self.instance
-        )
-        input_selection = ControlInputSelection(int(resp))
+        logger.debug("get the input selection for channel %s", self.instance)
+        resp: int = self._get_int32_value(parameter_id=2000)
+        input_selection = _CONTROL_INPUT_SELECTION_MAP[resp]
         return input_selection
 
     def set_output_stage_enable(self, output_stage_enable: OutputStageEnable) -> None:
@@ -570,10 +1030,8 @@ class MeerstetterTEC(object):
         :type output_stage_enable: OutputStageEnable
         :return: None
         """
-        logging.debug(f"set the output stage enable for channel {self.instance} to {output_stage_enable}")
-        self.mecom_basic_cmd.set_int32_value(
-            address=self.address, parameter_id=2010, instance=self.instance, value=output_stage_enable.value
-        )
+        logger.debug("set the output stage enable for channel %s to %s", self.instance, output_stage_enable)
+        self._set_int32_value(parameter_id=2010, value=output_stage_enable)
 
     def get_output_stage_enable(self) -> OutputStageEnable:
         """
@@ -582,11 +1040,9 @@ class MeerstetterTEC(object):
         :return: the output stage enable used by the TEC controller
         :rtype: OutputStageEnable
         """
-        logging.debug(f"get the output stage enable for channel {self.instance}")
-        resp: int = self.mecom_basic_cmd.get_int32_value(
-            address=self.address, parameter_id=2010, instance=self.instance
-        )
-        return OutputStageEnable(int(resp))
+        logger.debug("get the output stage enable for channel %s", self.instance)
+        resp: int = self._get_int32_value(parameter_id=2010)
+        return _OUTPUT_STAGE_ENABLE_MAP[resp]
 
     def set_current_limitation(self, current_limit_amps: float) -> None:
         """
@@ -596,12 +1052,8 @@ class MeerstetterTEC(object):
         :type current_limit_amps: float
         :return: None
         """
-        logging.debug(
-            f"set current limitation for channel {self.instance} to {float(current_limit_amps)} Amps"
-        )
-        self.mecom_basic_cmd.set_float_value(
-            address=self.address, parameter_id=2030, instance=self.instance, value=float(current_limit_amps)
-        )
+        logger.debug("set current limitation for channel %s to %s Amps", self.instance, current_limit_amps)
+        self._set_float_value(parameter_id=2030, value=current_limit_amps)
 
     def get_current_limitation(self) -> float:
         """
@@ -610,10 +1062,8 @@ class MeerstetterTEC(object):
         :return: the limiting drive current for the TEC controller in units of Amps
         :rtype: float
         """
-        logging.debug(f"get the current limitation for channel {self.instance}")
-        current_limit: float = self.mecom_basic_cmd.get_float_value(
-            address=self.address, parameter_id=2030, instance=self.instance
-        )
+        logger.debug("get the current limitation for channel %s", self.instance)
+        current_limit: float = self._get_float_value(parameter_id=2030)
         return current_limit
 
     def set_voltage_limitation(self, voltage_limit_volts: float) -> None:
@@ -624,12 +1074,8 @@ class MeerstetterTEC(object):
         :type voltage_limit_volts: float
         :return: None
         """
-        logging.debug(
-            f"set voltage limitation for channel {self.instance} to {float(voltage_limit_volts)} Volts"
-        )
-        self.mecom_basic_cmd.set_float_value(
-            address=self.address, parameter_id=2031, instance=self.instance, value=float(voltage_limit_volts)
-        )
+        logger.debug("set voltage limitation for channel %s to %s Volts", self.instance, voltage_limit_volts)
+        self._set_float_value(parameter_id=2031, value=voltage_limit_volts)
 
     def get_voltage_limitation(self) -> float:
         """
@@ -638,11 +1084,9 @@ class MeerstetterTEC(object):
         :return: the limiting drive voltage for the TEC controller in units of Volts
         :rtype: float
         """
-        logging.debug(f"get the voltage limitation for channel {self.instance}")
+        logger.debug("get the voltage limitation for channel %s", self.instance)
 
-        voltage_limit: float = self.mecom_basic_cmd.get_float_value(
-            address=self.address, parameter_id=2031, instance=self.instance
-        )
+        voltage_limit: float = self._get_float_value(parameter_id=2031)
         return voltage_limit
 
     def set_current_error_threshold(self, threshold_amps: float) -> None:
@@ -653,12 +1097,8 @@ class MeerstetterTEC(object):
         :type threshold_amps: float
         :return: none
         """
-        logging.debug(
-            f"set current error threshold for channel {self.instance} to {float(threshold_amps)} Amps"
-        )
-        self.mecom_basic_cmd.set_float_value(
-            address=self.address, parameter_id=2032, instance=self.instance, value=float(threshold_amps)
-        )
+        logger.debug("set current error threshold for channel %s to %s Amps", self.instance, threshold_amps)
+        self._set_float_value(parameter_id=2032, value=threshold_amps)
 
     def get_current_error_threshold(self) -> float:
         """
@@ -667,10 +1107,8 @@ class MeerstetterTEC(object):
         :return: the current error threshold in units of Amps
         :rtype: float
         """
-        logging.debug(f"get the current error threshold for channel {self.instance}")
-        curr_threshold: float = self.mecom_basic_cmd.get_float_value(
-            address=self.address, parameter_id=2032, instance=self.instance
-        )
+        logger.debug("get the current error threshold for channel %s", self.instance)
+        curr_threshold: float = self._get_float_value(parameter_id=2032)
         return curr_threshold
 
     def set_voltage_error_threshold(self, threshold_volts: float) -> None:
@@ -681,12 +1119,8 @@ class MeerstetterTEC(object):
         :type threshold_volts: float
         :return: none
         """
-        logging.debug(
-            f"set voltage error threshold for channel {self.instance} to {float(threshold_volts)} Volts"
-        )
-        self.mecom_basic_cmd.set_float_value(
-            address=self.address, parameter_id=2033, instance=self.instance, value=float(threshold_volts)
-        )
+        logger.debug("set voltage error threshold for channel %s to %s Volts", self.instance, threshold_volts)
+        self._set_float_value(parameter_id=2033, value=threshold_volts)
 
     def get_voltage_error_threshold(self) -> float:
         """
@@ -695,10 +1129,8 @@ class MeerstetterTEC(object):
         :return: the voltage error threshold in units of Volts
         :rtype: float
         """
-        logging.debug(f"get the voltage error threshold for channel {self.instance}")
-        volt_threshold: float = self.mecom_basic_cmd.get_float_value(
-            address=self.address, parameter_id=2033, instance=self.instance
-        )
+        logger.debug("get the voltage error threshold for channel %s", self.instance)
+        volt_threshold: float = self._get_float_value(parameter_id=2033)
         return volt_threshold
 
     def set_general_operating_mode(self, operating_mode: GeneralOperatingMode) -> None:
@@ -709,12 +1141,8 @@ class MeerstetterTEC(object):
         :type operating_mode: GeneralOperatingMode
         :return: None
         """
-        logging.debug(
-            f"set the general operating mode for channel {self.instance} to {operating_mode}"
-        )
-        self.mecom_basic_cmd.set_int32_value(
-            address=self.address, parameter_id=2040, instance=self.instance, value=operating_mode.value
-        )
+        logger.debug("set the general operating mode for channel %s to %s", self.instance, operating_mode)
+        self._set_int32_value(parameter_id=2040, value=operating_mode)
 
     def get_general_operating_mode(self) -> GeneralOperatingMode:
         """
@@ -723,11 +1151,9 @@ class MeerstetterTEC(object):
         :return: the operating mode of the TEC controller
         :rtype: GeneralOperatingMode
         """
-        logging.debug(f"get the general operating mode for channel {self.instance}")
-        resp: int = self.mecom_basic_cmd.get_int32_value(
-            address=self.address, parameter_id=2040, instance=self.instance
-        )
-        operating_mode = GeneralOperatingMode(int(resp))
+        logger.debug("get the general operating mode for channel %s", self.instance)
+        resp: int = self._get_int32_value(parameter_id=2040)
+        operating_mode = _GENERAL_OPERATING_MODE_MAP[resp]
         return operating_mode
 
     def get_base_baud_rate(self) -> int:
@@ -737,10 +1163,8 @@ class MeerstetterTEC(object):
         :return: the UART base baud rate
         :rtype: int
         """
-        logging.debug(f"get the UART base baud rate for channel {self.instance}")
-        baud_rate: int = self.mecom_basic_cmd.get_int32_value(
-            address=self.address, parameter_id=2050, instance=self.instance
-        )
+        logger.debug("get the UART base baud rate for channel %s", self.instance)
+        baud_rate: int = self._get_int32_cached(parameter_id=2050)
         return baud_rate
 
     def get_device_address(self) -> int:
@@ -756,7 +1180,7 @@ class MeerstetterTEC(object):
         :return: the device address
         :rtype: int
         """
-        logging.debug(f"get the device address for channel {self.instance}")
+        logger.debug("get the device address for channel %s", self.instance)
         device_address: int = self.mecom_basic_cmd.get_int32_value(
             address=0, parameter_id=2051, instance=self.instance
         )
@@ -769,10 +1193,8 @@ class MeerstetterTEC(object):
         :return: the UART response delay in units of microseconds (us)
         :rtype: float
         """
-        logging.debug(f"get the UART response delay for channel {self.instance}")
-        delay_us: int = self.mecom_basic_cmd.get_int32_value(
-            address=self.address, parameter_id=2052, instance=self.instance
-        )
+        logger.debug("get the UART response delay for channel %s", self.instance)
+        delay_us: int = self._get_int32_value(parameter_id=2052)
         return delay_us
 
     def set_temperature(self, temp_degc: float) -> None:
@@ -784,10 +1206,8 @@ class MeerstetterTEC(object):
         :type temp_degc: float
         :return: None
         """
-        logging.debug(f"set object temperature for channel {self.instance} to {temp_degc} C")
-        self.mecom_basic_cmd.set_float_value(
-            address=self.address, parameter_id=3000, instance=self.instance, value=float(temp_degc)
-        )
+        logger.debug("set object temperature for channel %s to %s C", self.instance, temp_degc)
+        self._set_float_value(parameter_id=3000, value=temp_degc)
 
     def set_coarse_temperature_ramp(self, temp_ramp_degc_per_sec: float) -> None:
         """
@@ -798,12 +1218,10 @@ class MeerstetterTEC(object):
         :type temp_ramp_degc_per_sec: float
         :return: None
         """
-        logging.debug(
-            f"set coarse temperature ramp for channel {self.instance} to {float(temp_ramp_degc_per_sec)} degC/second"
-        )
-        self.mecom_basic_cmd.set_float_value(
-            address=self.address, parameter_id=3003, instance=self.instance, value=float(temp_ramp_degc_per_sec)
+        logger.debug(
+            "set coarse temperature ramp for channel %s to %s degC/second", self.instance, temp_ramp_degc_per_sec
         )
+        self._set_float_value(parameter_id=3003, value=temp_ramp_degc_per_sec)
 
     def get_coarse_temperature_ramp(self) -> float:
         """
@@ -813,10 +1231,8 @@ class MeerstetterTEC(object):
             in units of degC/second
         :rtype: float
         """
-        logging.debug(f"get the coarse temperature ramp for channel {self.instance}")
-        temp_ramp: float = self.mecom_basic_cmd.get_float_value(
-            address=self.address, parameter_id=3003, instance=self.instance
-        )
+        logger.debug("get the coarse temperature ramp for channel %s", self.instance)
+        temp_ramp: float = self._get_float_value(parameter_id=3003)
         return temp_ramp
 
     def set_proportional_gain(self, prop_gain: float) -> None:
@@ -827,12 +1243,8 @@ class MeerstetterTEC(object):
         :type prop_gain: float
         :return: None
         """
-        logging.debug(
-            f"set the proportional gain (Kp) for channel {self.instance} to {float(prop_gain)}"
-        )
-        self.mecom_basic_cmd.set_float_value(
-            address=self.address, parameter_id=3010, instance=self.instance, value=float(prop_gain)
-        )
+        logger.debug("set the proportional gain (Kp) for channel %s to %s", self.instance, prop_gain)
+        self._set_float_value(parameter_id=3010, value=prop_gain)
 
     def get_proportional_gain(self) -> float:
         """
@@ -841,10 +1253,8 @@ class MeerstetterTEC(object):
         :return: the proportional gain (Kp)
         :rtype: float
         """
-        logging.debug(f"get the proportional gain (Kp) for channel {self.instance}")
-        proportional_gain: float = self.mecom_basic_cmd.get_float_value(
-            address=self.address, parameter_id=3010, instance=self.instance
-        )
+        logger.debug("get the proportional gain (Kp) for channel %s", self.instance)
+        proportional_gain: float = self._get_float_value(parameter_id=3010)
         return proportional_gain
 
     def set_integration_time(self, int_time_sec: float) -> None:
@@ -855,12 +1265,8 @@ class MeerstetterTEC(object):
         :type int_time_sec: float
         :return: None
         """
-        logging.debug(
-            f"set the integration time (Ti) for channel {self.instance} to {float(int_time_sec)} seconds"
-        )
-        self.mecom_basic_cmd.set_float_value(
-            address=self.address, parameter_id=3011, instance=self.instance, value=float(int_time_sec)
-        )
+        logger.debug("set the integration time (Ti) for channel %s to %s seconds", self.instance, int_time_sec)
+        self._set_float_value(parameter_id=3011, value=int_time_sec)
 
     def get_integration_time(self) -> float:
         """
@@ -869,10 +1275,8 @@ class MeerstetterTEC(object):
         :return: the integration time (Ti) in units of seconds
         :rtype: float
         """
-        logging.debug(f"get the integration time (Ti) for channel {self.instance}")
-        integration_time: float = self.mecom_basic_cmd.get_float_value(
-            address=self.address, parameter_id=3011, instance=self.instance
-        )
+        logger.debug("get the integration time (Ti) for channel %s", self.instance)
+        integration_time: float = self._get_float_value(parameter_id=3011)
         return integration_time
 
     def set_differential_time(self, diff_time_sec: float) -> None:
@@ -883,12 +1287,8 @@ class MeerstetterTEC(object):
         :type diff_time_sec: float
         :return: None
         """
-        logging.debug(
-            f"set the differential time (Td) for channel {self.instance} to {float(diff_time_sec)} seconds"
-        )
-        self.mecom_basic_cmd.set_float_value(
-            address=self.address, parameter_id=3012, instance=self.instance, value=float(diff_time_sec)
-        )
+        logger.debug("set the differential time (Td) for channel %s to %s seconds", self.instance, diff_time_sec)
+        self._set_float_value(parameter_id=3012, value=diff_time_sec)
 
     def get_differential_time(self) -> float:
         """
@@ -897,10 +1297,8 @@ class MeerstetterTEC(object):
         :return: the differential time (Td) in units of seconds
         :rtype: float
         """
-        logging.debug(f"get the differential time (Td) for channel {self.instance}")
-        differential_time: float = self.mecom_basic_cmd.get_float_value(
-            address=self.address, parameter_id=3012, instance=self.instance
-        )
+        logger.debug("get the differential time (Td) for channel %s", self.instance)
+        differential_time: float = self._get_float_value(parameter_id=3012)
         return differential_time
 
     def set_part_damping(self, part_damping: float) -> None:
@@ -912,10 +1310,8 @@ class MeerstetterTEC(object):
         :type part_damping: float
         :return: None
         """
-        logging.debug(f"set D Part Damping PT1 for channel {self.instance} to {float(part_damping)}")
-        self.mecom_basic_cmd.set_float_value(
-            address=self.address, parameter_id=3013, instance=self.instance, value=float(part_damping)
-        )
+        logger.debug("set D Part Damping PT1 for channel %s to %s", self.instance, part_damping)
+        self._set_float_value(parameter_id=3013, value=part_damping)
 
     def get_part_damping(self) -> float:
         """
@@ -925,10 +1321,8 @@ class MeerstetterTEC(object):
         :return: D Part Damping PT1 value
         :rtype: float
         """
-        logging.debug(f"get D Part Damping PT1 for channel {self.instance}")
-        part_damping: float = self.mecom_basic_cmd.get_float_value(
-            address=self.address, parameter_id=3013, instance=self.instance
-        )
+        logger.debug("get D Part Damping PT1 for channel %s", self.instance)
+        part_damping: float = self._get_float_value(parameter_id=3013)
         return part_damping
 
     def set_thermal_regulation_mode(self, regulation_mode: ThermalRegulationMode) -> None:
@@ -939,10 +1333,8 @@ class MeerstetterTEC(object):
         :type regulation_mode: ThermalRegulationMode
         :return: None
         """
-        logging.debug(f"set the thermal regulation mode for channel {self.instance} to {regulation_mode}")
-        self.mecom_basic_cmd.set_int32_value(
-            address=self.address, parameter_id=3020, instance=self.instance, value=regulation_mode.value
-        )
+        logger.debug("set the thermal regulation mode for channel %s to %s", self.instance, regulation_mode)
+        self._set_int32_value(parameter_id=3020, value=regulation_mode)
 
     def get_thermal_regulation_mode(self) -> ThermalRegulationMode:
         """
@@ -951,11 +1343,9 @@ class MeerstetterTEC(object):
         :return: the thermal regulation mode
         :rtype: ThermalRegulationMode
         """
-        logging.debug(f"get the thermal regulation mode for channel {self.instance}")
-        resp: int = self.mecom_basic_cmd.get_int32_value(
-            address=self.address, parameter_id=3020, instance=self.instance
-        )
-        regulation_mode = ThermalRegulationMode(int(resp))
+        logger.debug("get the thermal regulation mode for channel %s", self.instance)
+        resp: int = self._get_int32_value(parameter_id=3020)
+        regulation_mode = _THERMAL_REGULATION_MODE_MAP[resp]
         return regulation_mode
 
     def set_positive_current_is(self, positive_current_is: PositiveCurrentIs) -> None:
@@ -968,10 +1358,8 @@ class MeerstetterTEC(object):
         :type positive_current_is: PositiveCurrentIs
         :return: None
         """
-        logging.debug(f"set the positive current is for channel {self.instance} to {positive_current_is}")
-        self.mecom_basic_cmd.set_int32_value(
-            address=self.address, parameter_id=3034, instance=self.instance, value=positive_current_is.value
-        )
+        logger.debug("set the positive current is for channel %s to %s", self.instance, positive_current_is)
+        self._set_int32_value(parameter_id=3034, value=positive_current_is)
 
     def get_positive_current_is(self) -> PositiveCurrentIs:
         """
@@ -982,11 +1370,9 @@ class MeerstetterTEC(object):
             heating of the TEC
         :rtype: PositiveCurrentIs
         """
-        logging.debug(f"get the positive current is for channel {self.instance}")
-        resp: int = self.mecom_basic_cmd.get_int32_value(
-            address=self.address, parameter_id=3034, instance=self.instance
-        )
-        return PositiveCurrentIs(int(resp))
+        logger.debug("get the positive current is for channel %s", self.instance)
+        resp: int = self._get_int32_value(parameter_id=3034)
+        return _POSITIVE_CURRENT_IS_MAP[resp]
 
     def set_object_sensor_type(self, sensor_type: ObjectSensorType) -> None:
         """
@@ -996,10 +1382,8 @@ class MeerstetterTEC(object):
         :type sensor_type: ObjectSensorType
         :return: None
         """
-        logging.debug(f"set the object sensor type for channel {self.instance} to {sensor_type}")
-        self.mecom_basic_cmd.set_int32_value(
-            address=self.address, parameter_id=4034, instance=self.instance, value=sensor_type.value
-        )
+        logger.debug("set the object sensor type for channel %s to %s", self.instance, sensor_type)
+        self._set_int32_value(parameter_id=4034, value=sensor_type)
 
     def get_object_sensor_type(self) -> ObjectSensorType:
         """
@@ -1009,11 +1393,9 @@ class MeerstetterTEC(object):
         :return: the type of temperature sensor being used to provide feedback
         :rtype: ObjectSensorType
         """
-        logging.debug(f"get the object sensor type for channel {self.instance}")
-        resp: int = self.mecom_basic_cmd.get_int32_value(
-            address=self.address, parameter_id=4034, instance=self.instance
-        )
-        return ObjectSensorType(int(resp))
+        logger.debug("get the object sensor type for channel %s", self.instance)
+        resp: int = self._get_int32_value(parameter_id=4034)
+        return _OBJECT_SENSOR_TYPE_MAP[resp]
 
     def download_lookup_table(self, filepath: str) -> None:
         """
@@ -1025,26 +1407,25 @@ class MeerstetterTEC(object):
         :raises LutException:
         :return: None
         """
-        logging.debug(f"download the lookup table for channel {self.instance}")
+        logger.debug("download the lookup table for channel %s", self.instance)
         # Enter the path to the lookup table file (*.csv)
         try:
             self.mecom_lut_cmd.download_lookup_table(address=self.address, filepath=filepath)
-            timeout: int = 0
+            # Back off exponentially from 5 ms up to 50 ms within a 500 ms budget
+            delay: float = 0.005
+            start_time: float = time.perf_counter()
             while True:
                 status: LutStatus = (
                     self.mecom_lut_cmd.get_status(address=self.address, instance=self.instance)
                 )
-                logging.info(f"LutCmd status : {status}")
-                if status == LutStatus.NO_INIT or status == LutStatus.ANALYZING:
-                    timeout += 1
-                    if timeout < 50:
-                        time.sleep(0.010)
-                    else:
-                        raise LutException("Timeout while trying to get Lookup Table status!")
-                else:
+                logger.info("LutCmd status : %s", status)
+                if status != LutStatus.NO_INIT and status != LutStatus.ANALYZING:
                     break
-            lut_table_status = self.mecom_lut_cmd.get_status(address=self.address, instance=self.instance)
-            logging.info(f"Lookup Table Status (52002): {lut_table_status}")
+                if time.perf_counter() - start_time >= 0.5:
+                    raise LutException("Timeout while trying to get Lookup Table status!")
+                time.sleep(delay)
+                delay = min(delay * 2, 0.050)
+            logger.info("Lookup Table Status (52002): %s", status)
         except LutException as e:
             raise LutException(f"Error while trying to download lookup table: {e}")
 
@@ -1055,7 +1436,7 @@ class MeerstetterTEC(object):
         :raises ComCommandException:
         :return: None
         """
-        logging.debug(f"start the lookup table for channel {self.instance}")
+        logger.debug("start the lookup table for channel %s", self.instance)
         try:
             self.mecom_lut_cmd.start_lookup_table(address=self.address, instance=self.instance)
         except LutException as e:
@@ -1068,7 +1449,7 @@ class MeerstetterTEC(object):
         :raises ComCommandException:
         :return: None
         """
-        logging.debug(f"stop the lookup table for channel {self.instance}")
+        logger.debug("stop the lookup table for channel %s", self.instance)
         try:
             self.mecom_lut_cmd.stop_lookup_table(address=self.address, instance=self.instance)
         except LutException as e:
@@ -1081,12 +1462,24 @@ class MeerstetterTEC(object):
         :return: the status for the lookup table
         :rtype: LutStatus
         """
-        logging.debug(f"get the lookup table status for channel {self.instance}")
+        logger.debug("get the lookup table status for channel %s", self.instance)
         status: LutStatus = (
             self.mecom_lut_cmd.get_status(address=self.address, instance=self.instance)
         )
         return status
 
+    def get_lookup_table_line(self) -> int:
+        """
+        Get the number of the lookup table line that is currently executed. Only valid
+        while the lookup table status is LutStatus.EXECUTING.
+
+        :return: the currently executed lookup table line
+        :rtype: int
+        """
+        logger.debug("get the lookup table line for channel %s", self.instance)
+        line: int = self.mecom_lut_cmd.get_current_table_line(address=self.address, instance=self.instance)
+        return line
+
     def execute_lookup_table(self, timeout: float = 300) -> bool:
         """
         Runs through the entire process for successfully executing a
@@ -1100,11 +1493,13 @@ class MeerstetterTEC(object):
 
         :param timeout: Timeout period in units of seconds.
         :type timeout: float
-        :return: True if the lookup table was executed successfully,
-            False otherwise.
+        :raises LutException: If the lookup table does not start executing or does not
+            complete its execution within the timeout period.
+        :return: True once the lookup table was executed successfully, failures are
+            raised.
         :rtype: bool
         """
-        logging.debug(f"execute the lookup table for channel {self.instance}")
+        logger.debug("execute the lookup table for channel %s", self.instance)
 
         success: bool = False
 
@@ -1116,12 +1511,12 @@ class MeerstetterTEC(object):
             self.start_lookup_table()
 
             lut_status: LutStatus = self.get_lookup_table_status()
-            logging.info(f"lookup table status : {lut_status}")
+            logger.info("lookup table status : %s", lut_status)
 
             if lut_status != LutStatus.EXECUTING:
-                logging.exception(
+                logger.error(
                     "The lookup status should be LutStatus.EXECUTING after starting the lookup table ; "
-                    f"instead the lookup status is {lut_status}."
+                    "instead the lookup status is %s.", lut_status
                 )
                 raise LutException(
                     "The lookup status should be LutStatus.EXECUTING after starting the lookup table ; "
@@ -1129,26 +1524,27 @@ class MeerstetterTEC(object):
                 )
 
             runtime = 0.0
-            start_time = time.time()  # acquisition start
-            acq = 0
-            lut_status: LutStatus = self.get_lookup_table_status()
+            start_time = time.perf_counter()  # acquisition start
+            last_temperature_log = last_status_log = start_time
+            # The status is polled quickly at first, then less often the longer the table runs
+            interval = 0.05
+            max_interval = 1.0
+            # lut_status still holds the EXECUTING status checked above
             while lut_status == LutStatus.EXECUTING and runtime < timeout:
-                runtime = time.time() - start_time  # runtime is in units of seconds
-                time.sleep(0.1)
+                time.sleep(min(interval, max(timeout - runtime, 0.0)))
+                interval = min(interval * 1.5, max_interval)
+                now = time.perf_counter()
+                runtime = now - start_time  # runtime is in units of seconds
 
-                acq += 1
+                if now - last_temperature_log >= 2.0:
+                    last_temperature_log = now
+                    logger.info("The object temperature is %s degC", self.get_temperature())
 
-                if acq % 20 == 0:
-                    logging.info(
-                        f"The object temperature is {self.get_temperature()} degC"
-                    )
+                if now - last_status_log >= 20.0:
+                    last_status_log = now
+                    logger.info("lookup table status : %s ; line %s", lut_status, self.get_lookup_table_line())
 
-                if acq % 200 == 0:
-                    logging.info(f"lookup table status : {self.get_lookup_table_status()}")
-
-                    logging.info(
-                        f"The lookup table has been executing for {round(acq * 0.1)} seconds..."
-                    )
+                    logger.info("The lookup table has been executing for %s seconds...", round(runtime))
 
                 lut_status: LutStatus = self.get_lookup_table_status()
 
@@ -1158,7 +1554,7 @@ class MeerstetterTEC(object):
                     "the lookup table took longer than expected to completely execute..."
                 )
 
-            logging.info(f"The Lookup Table has executed successfully after {round(runtime, 3)} seconds...")
+            logger.info("The Lookup Table has executed successfully after %s seconds...", round(runtime, 3))
 
             success = True
 
@@ -1171,14 +1567,15 @@ class MeerstetterTEC(object):
             raise e
 
         finally:
-            if self.get_lookup_table_status() == LutStatus.EXECUTING:
+            # On success the last polled status already showed the table is no longer executing
+            if not success and self.get_lookup_table_status() == LutStatus.EXECUTING:
                 self.stop_lookup_table()
-                logging.info(
+                logger.info(
                     "Lookup Table was force stopped ; this may be because the "
                     "routine timed out while the lookup table was still executing..."
                 )
 
-            return success
+        return success
 
     def _set_enable(self, enable: bool = True) -> None:
         """
@@ -1189,10 +1586,8 @@ class MeerstetterTEC(object):
         :return: None
         """
         value, description = (1, "on") if enable else (0, "off")
-        logging.debug(f"set loop for channel {self.instance} to {description}")
-        self.mecom_basic_cmd.set_int32_value(
-            address=self.address, parameter_id=2010, instance=self.instance, value=value
-        )
+        logger.debug("set loop for channel %s to %s", self.instance, description)
+        self._set_int32_value(parameter_id=2010, value=value)
 
     def enable(self) -> None:
         """
@@ -1218,30 +1613,25 @@ class MeerstetterTEC(object):
         :return:
         :rtype: str
         """
-        data_log: str = ""
-        if header is True:
-            data_log += (
-                "Time;CH 1 Object Temperature;CH 1 Sink Temperature;CH 1 Target Object Temperature;"
-                "CH 1 (Ramp) Nominal Temperature;CH 1 Thermal Power Model Current;CH 1 Actual Output Current;"
-                "CH 1 Actual Output Voltage;CH 1 PID Control Variable;\n"
-            )
         time_datetime: datetime.datetime = datetime.datetime.fromtimestamp(time.time())
-        object_temperature: float = self.get_temperature()
-        sink_temperature: float = self.get_sink_temperature()
-        setpoint_temperature: float = self.get_setpoint_temperature()
-        ramp_nominal_temperature: float = self.get_ramp_nominal_object_temperature()
-        thermal_power_model_current: float = self.get_thermal_power_model_current()
-        actual_output_current: float = self.get_tec_current()
-        actual_output_voltage: float = self.get_tec_voltage()
-        pid_control_variable: float = self.get_pid_control_variable()
-        data_log += (
-            f"{time_datetime};{object_temperature:.6f};{sink_temperature};{setpoint_temperature};"
-            f"{ramp_nominal_temperature};{thermal_power_model_current:.6f};{actual_output_current:.6f};"
-            f"{actual_output_voltage:.6f};{pid_control_variable:.6f};\n"
-        )
+        (
+            object_temperature, sink_temperature, setpoint_temperature, ramp_nominal_temperature,
+            thermal_power_model_current, actual_output_current, actual_output_voltage, pid_control_variable
+        ) = self.mecom_basic_cmd.get_float_values(
+            address=self.address,
+            parameters=[(parameter_id, self.instance) for parameter_id in self._MONITOR_PARAMETER_IDS]
+        )
+        row: List[str] = [
+            str(time_datetime), f"{object_temperature:.6f}", str(sink_temperature), str(setpoint_temperature),
+            str(ramp_nominal_temperature), f"{thermal_power_model_current:.6f}", f"{actual_output_current:.6f}",
+            f"{actual_output_voltage:.6f}", f"{pid_control_variable:.6f}", "\n"
+        ]
+        data_log: str = ";".join(row)
+        if header is True:
+            data_log = self._MONITOR_HEADER_LINE + data_log
         return data_log
 
-    def wait_for_stable_temperature(self, timeout: int = 120) -> None:
+    def wait_for_stable_temperature(self, timeout: int = 120, stable_event: Optional[threading.Event] = None) -> None:
         """
         Wait for the temperature to stabilize after calling
         the set_temperature() method.
@@ -1250,23 +1640,78 @@ class MeerstetterTEC(object):
         the "Temperature is Stable" status has been updated after the
         set_temperature() is called. It takes approximately a half second
         for the "Temperature is Stable" status to be updated after the
-        set_temperature() call.
+        set_temperature() call. The status is then polled every 100 ms;
+        once the temperature has been unstable for two seconds, the poll
+        interval grows by half on every poll up to one second.
+
+        Other threads can wait on stable_event instead of polling the
+        device themselves; it is set once the temperature is stable.
 
         :param timeout: the timeout period in units of seconds
         :type timeout: int
+        :param stable_event: Optional event that is set once the temperature is stable.
+        :type stable_event: Optional[threading.Event]
         :raises TimeoutException:
         :return: None
         """
         time.sleep(1.0)
         runtime: float = 0.0
-        start_time: float = time.time()
-        stabilizing: bool = self.is_temperature_stable()
-        while stabilizing is False and runtime < timeout:
-            stabilizing: bool = self.is_temperature_stable()
-            runtime = time.time() - start_time  # runtime is in units of seconds
-            time.sleep(0.5)
-        if runtime >= timeout:
-            raise TimeoutException(f"wait_for_stable_temperature() timed out after {runtime} seconds")
+        interval: float = 0.1
+        # The device tracks the stability itself, in parameter 1200 "Temperature is Stable"
+        # (0: regulation not active, 1: not stable, 2: stable), so each poll is one INT32 query
+        get_int32_value = self._get_int32_value
+        stable: int = TemperatureStability.STABLE.value
+        start_time: float = time.perf_counter()
+        while get_int32_value(parameter_id=1200) != stable:
+            runtime = time.perf_counter() - start_time  # runtime is in units of seconds
+            if runtime >= timeout:
+                raise TimeoutException(f"wait_for_stable_temperature() timed out after {runtime} seconds")
+            if runtime >= 2.0:
+                interval = min(interval * 1.5, 1.0)
+            time.sleep(interval)
+        if stable_event is not None:
+            stable_event.set()
+
+    def wait_until_stable(
+            self, timeout_s: float = 120.0, poll_hz: float = 10.0, window_s: float = 10.0, tol: float = 0.1
+    ) -> float:
+        """
+        Poll the object temperature at a fixed rate and wait until the standard deviation
+        of the samples within a sliding time window is less than the defined threshold.
+
+        The standard deviation is updated incrementally from running sums over a ring
+        buffer, so each poll costs the same regardless of the window length.
+
+        :param timeout_s: the timeout period in units of seconds
+        :type timeout_s: float
+        :param poll_hz: the polling rate in units of Hz
+        :type poll_hz: float
+        :param window_s: the length of the sliding window in units of seconds
+        :type window_s: float
+        :param tol: threshold standard deviation (units of degC) needed for the temperature
+            to be considered stable
+        :type tol: float
+        :raises TimeoutException:
+        :return: the time taken for the object temperature to become stable in units of seconds
+        :rtype: float
+        """
+        period: float = 1.0 / poll_hz
+        sliding_std_dev: _SlidingStdDev = _SlidingStdDev(window=max(2, int(window_s * poll_hz)))
+        get_temperature = self.get_temperature
+
+        start_time: float = time.perf_counter()
+        next_poll: float = start_time
+        while True:
+            standard_deviation: Optional[float] = sliding_std_dev.add(get_temperature())
+            if standard_deviation is not None:
+                logger.debug("standard_deviation: %s", standard_deviation)
+                if standard_deviation < tol:
+                    return time.perf_counter() - start_time
+
+            if time.perf_counter() - start_time >= timeout_s:
+                raise TimeoutException(f"wait_until_stable() timed out after {timeout_s} seconds")
+            next_poll += period
+            time.sleep(max(0.0, next_poll - time.perf_counter()))
 
     def set_and_stabilize_tec_temperature(
             self, temperature: float = 30.0, threshold_deg_c: float = 0.1
@@ -1287,67 +1732,100 @@ class MeerstetterTEC(object):
             temperature to become stable
         :rtype: float, List[float]
         """
-        self.disable()
+        # Only switch the control loop on when the device reports it is not on already. Turning
+        # it off and on around the write costs two round-trips and briefly interrupts the regulation.
+        loop_enabled: bool = self._get_int32_value(parameter_id=2010) == 1
         try:
             self.set_temperature(float(temperature))
         finally:
-            self.enable()
-        start_time: float = time.time()
-        logging.info("Waiting for the temperature to stabilize...")
+            if not loop_enabled:
+                self.enable()
+        start_time: float = time.perf_counter()
+        logger.info("Waiting for the temperature to stabilize...")
         standard_deviation_list: List[float] = []
-        standard_deviation = 1
+        # Using the last 100 samples to calculate the standard deviation; after the window is
+        # filled once, every pass takes one new sample
+        sliding_std_dev: _SlidingStdDev = _SlidingStdDev(window=100)
+        get_temperature = self.get_temperature
+        standard_deviation: float = 1
         # Measured (i.e. object) temperature standard deviation < threshold_deg_c
         while standard_deviation > threshold_deg_c:
-            # Using 100 samples to calculate the standard deviation
-            object_temperatures: List[float] = [self.get_temperature() for _ in range(100)]
-            logging.debug(f"Object temperatures: {object_temperatures}")
-            # Using statistics package to find the standard deviation
-            standard_deviation: float = statistics.stdev(object_temperatures)
-            logging.debug(f"standard_deviation: {standard_deviation}")
+            window_std_dev: Optional[float] = sliding_std_dev.add(get_temperature())
+            if window_std_dev is None:
+                continue
+            standard_deviation = window_std_dev
+            logger.debug("standard_deviation: %s", standard_deviation)
             standard_deviation_list.append(standard_deviation)
-        total_time_to_stabilize = time.time() - start_time
+        total_time_to_stabilize = time.perf_counter() - start_time
         return total_time_to_stabilize, standard_deviation_list
 
-    def get_all_settings(self) -> dict:
+    def get_settings(self) -> TecSettings:
         """
         Query all settings from the device.
 
+        The identity values are cached after the first call and the device address is the
+        one found while connecting. All other parameters are queried with one pipelined
+        transaction.
+
         :return:
+        :rtype: TecSettings
+        """
+        model, hw, sn, fw, baud_rate = self._get_int32_values_cached(parameter_ids=[100, 101, 102, 103, 2050])
+        parameters: List[Tuple[int, type]] = [
+            (104, int), (1000, float), (1010, float), (1020, float), (1021, float), (1063, float),
+            (2000, int), (2030, float), (2031, float), (2032, float), (2033, float), (2040, int),
+            (2052, int), (3003, float), (3010, float), (3011, float), (3012, float), (3013, float),
+            (3020, int), (3034, int), (4034, int), (2010, int)
+        ]
+        logger.debug("get all settings for channel %s", self.instance)
+        values: Dict[int, Union[float, int]] = dict(zip(
+            [parameter_id for parameter_id, _ in parameters],
+            self.mecom_basic_cmd.get_values(
+                address=self.address,
+                parameters=[(parameter_id, self.instance, value_type) for parameter_id, value_type in parameters]
+            )
+        ))
+        return TecSettings(
+            idn=f"Meerstetter,TEC{model},{sn},{hw},{fw}",
+            device_address=self.address,
+            device_type=model,
+            serial_number=sn,
+            hardware_version=hw,
+            firmware_id=self.get_firmware_identification_string(),
+            firmware_version=fw,
+            device_status=_DEVICE_STATUS_MAP[values[104]],
+            object_temperature=values[1000],
+            setpoint_temperature=values[1010],
+            actual_output_current=values[1020],
+            actual_output_voltage=values[1021],
+            device_temperature=values[1063],
+            input_selection=_CONTROL_INPUT_SELECTION_MAP[values[2000]],
+            current_limitation=values[2030],
+            voltage_limitation=values[2031],
+            current_error_threshold=values[2032],
+            voltage_error_threshold=values[2033],
+            general_operating_mode=_GENERAL_OPERATING_MODE_MAP[values[2040]],
+            base_baud_rate=baud_rate,
+            uart_response_delay=values[2052],
+            coarse_temp_ramp=values[3003],
+            proportional_gain_kp=values[3010],
+            integration_time_ti=values[3011],
+            differential_time_td=values[3012],
+            pid_part_damping=values[3013],
+            thermal_regulation_mode=_THERMAL_REGULATION_MODE_MAP[values[3020]],
+            positive_current_is=_POSITIVE_CURRENT_IS_MAP[values[3034]],
+            object_sensor_type=_OBJECT_SENSOR_TYPE_MAP[values[4034]],
+            output_stage_enable=_OUTPUT_STAGE_ENABLE_MAP[values[2010]]
+        )
+
+    def get_all_settings(self) -> dict:
+        """
+        Query all settings from the device.
+
+        :return: The settings of get_settings() as a dict keyed by field name.
         :rtype: dict
         """
-        settings = {
-            "idn": self.get_id(),
-            "device_address": self.get_device_address(),
-            "device_type": self.get_device_type(),
-            "serial_number": self.get_serial_number(),
-            "hardware_version": self.get_hardware_version(),
-            "firmware_id": self.get_firmware_identification_string(),
-            "firmware_version": self.get_firmware_version(),
-            "device_status": self.get_device_status(),
-            "object_temperature": self.get_temperature(),
-            "setpoint_temperature": self.get_setpoint_temperature(),
-            "actual_output_current": self.get_tec_current(),
-            "actual_output_voltage": self.get_tec_voltage(),
-            "device_temperature": self.get_device_temperature(),
-            "input_selection": self.get_input_selection(),
-            "current_limitation": self.get_current_limitation(),
-            "voltage_limitation": self.get_voltage_limitation(),
-            "current_error_threshold": self.get_current_error_threshold(),
-            "voltage_error_threshold": self.get_voltage_error_threshold(),
-            "general_operating_mode": self.get_general_operating_mode(),
-            "base_baud_rate": self.get_base_baud_rate(),
-            "uart_response_delay": self.get_uart_response_delay(),
-            "coarse_temp_ramp": self.get_coarse_temperature_ramp(),
-            "proportional_gain_kp": self.get_proportional_gain(),
-            "integration_time_ti": self.get_integration_time(),
-            "differential_time_td": self.get_differential_time(),
-            "pid_part_damping": self.get_part_damping(),
-            "thermal_regulation_mode": self.get_thermal_regulation_mode(),
-            "positive_current_is": self.get_positive_current_is(),
-            "object_sensor_type": self.get_object_sensor_type(),
-            "output_stage_enable": self.get_output_stage_enable()
-        }
-        return settings
+        return self.get_settings().as_dict()
 
 
 def main():
@@ -1372,9 +1850,11 @@ def main():
         f"type {type(firmware_identification_string)}\n"
     )
 
-    logging.info(f"device_type : {mc.get_device_type()} ; type {type(mc.get_device_type())}\n")
+    device_type: int = mc.get_device_type()
+    logging.info(f"device_type : {device_type} ; type {type(device_type)}\n")
 
-    logging.info(f"temperature : {mc.get_temperature()} ; type {type(mc.get_temperature())}\n")
+    temperature: float = mc.get_temperature()
+    logging.info(f"temperature : {temperature} ; type {type(temperature)}\n")
 
     filepath_: str = (
         os.path.join(
@@ -1385,24 +1865,31 @@ def main():
     mc.download_lookup_table(filepath=filepath_)
 
     mc.set_proportional_gain(prop_gain=50.0)
-    logging.info(f"proportional_gain : {mc.get_proportional_gain()} ; type {type(mc.get_proportional_gain())}\n")
+    proportional_gain: float = mc.get_proportional_gain()
+    logging.info(f"proportional_gain : {proportional_gain} ; type {type(proportional_gain)}\n")
 
     mc.set_proportional_gain(prop_gain=60.0)
-    logging.info(f"proportional_gain : {mc.get_proportional_gain()} ; type {type(mc.get_proportional_gain())}\n")
+    proportional_gain: float = mc.get_proportional_gain()
+    logging.info(f"proportional_gain : {proportional_gain} ; type {type(proportional_gain)}\n")
 
     mc.set_integration_time(int_time_sec=40.0)
-    logging.info(f"integration_time : {mc.get_integration_time()} ; type {type(mc.get_integration_time())}\n")
+    integration_time: float = mc.get_integration_time()
+    logging.info(f"integration_time : {integration_time} ; type {type(integration_time)}\n")
 
     mc.set_integration_time(int_time_sec=45.0)
-    logging.info(f"integration_time : {mc.get_integration_time()} ; type {type(mc.get_integration_time())}\n")
+    integration_time: float = mc.get_integration_time()
+    logging.info(f"integration_time : {integration_time} ; type {type(integration_time)}\n")
 
     mc.set_differential_time(diff_time_sec=1.0)
-    logging.info(f"differential_time : {mc.get_differential_time()} ; type {type(mc.get_differential_time())}\n")
+    differential_time: float = mc.get_differential_time()
+    logging.info(f"differential_time : {differential_time} ; type {type(differential_time)}\n")
 
     mc.set_differential_time(diff_time_sec=0.0)
-    logging.info(f"differential_time : {mc.get_differential_time()} ; type {type(mc.get_differential_time())}\n")
+    differential_time: float = mc.get_differential_time()
+    logging.info(f"differential_time : {differential_time} ; type {type(differential_time)}\n")
 
-    logging.info(f"part_damping : {mc.get_part_damping()} ; type {type(mc.get_part_damping())}\n")
+    part_damping: float = mc.get_part_damping()
+    logging.info(f"part_damping : {part_damping} ; type {type(part_damping)}\n")
 
     mc.tear()
 